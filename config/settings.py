@@ -74,6 +74,8 @@ class Config:
         default_download_dir = str(Path.home() / "Downloads" / "ЕИС_Документация")
         self.unrar_tool = self._get_env_var("UNRAR_TOOL", None)
         self.document_download_dir = self._get_env_var("DOCUMENT_DOWNLOAD_DIR", default_download_dir)
+        # Число параллельных скачиваний документов закупки (1..64)
+        self.document_download_workers = min(max(self._get_env_int("DOCUMENT_DOWNLOAD_WORKERS", 16), 1), 64)
         self.winrar_path = self._get_env_var("WINRAR_PATH", None)
         # Директория для документов по командировкам (чеки, отчеты)
         self.business_trip_docs_dir = self._get_env_var("BUSINESS_TRIP_DOCS_DIR", None)
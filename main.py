@@ -1,4 +1,5 @@
 from ui.main_window import MainWindow
+from modules.styles.bids_styles import install_tender_card_styles
 from PyQt5.QtWidgets import QApplication
 from PyQt5.QtCore import Qt
 import sys
@@ -18,6 +19,9 @@ if __name__ == "__main__":
     app.setAttribute(Qt.AA_EnableHighDpiScaling, True)
     app.setAttribute(Qt.AA_UseHighDpiPixmaps, True)
 
+    # Общая таблица стилей карточек закупок (разбирается Qt один раз)
+    install_tender_card_styles(app)
+
     # Устанавливаем переменные окружения для Qt
     os.environ["QT_ENABLE_HIGHDPI_SCALING"] = "1"
     os.environ["QT_AUTO_SCREEN_SCALE_FACTOR"] = "1"
@@ -14,9 +14,6 @@ from typing import Optional, Dict, Any
 from loguru import logger
 
 # Импортируем единые стили
-from modules.styles.general_styles import (
-    apply_label_style, apply_text_color, apply_font_weight
-)
 from modules.styles.bids_styles import apply_bid_card_style
 
 
@@ -48,7 +45,8 @@ class BidCard(QFrame):
         layout.setSpacing(8)
         layout.setContentsMargins(12, 12, 12, 12)
         
-        # Стиль карточки
+        # Стиль карточки; метки оформляются его правилами по свойству role,
+        # поэтому собственные таблицы стилей меткам не нужны
         apply_bid_card_style(self)
         
         # Включаем возможность перетаскивания
@@ -57,32 +55,26 @@ class BidCard(QFrame):
         # Номер закупки
         bid_number = self.bid_data.get('number', 'Без номера')
         number_label = QLabel(f"№ {bid_number}")
-        apply_label_style(number_label, 'normal')
-        apply_font_weight(number_label)
-        apply_text_color(number_label, 'primary')
+        number_label.setProperty("role", "number")
         layout.addWidget(number_label)
         
         # Название закупки
         bid_name = self.bid_data.get('name', 'Без названия')
         name_label = QLabel(bid_name)
-        apply_label_style(name_label, 'normal')
+        name_label.setProperty("role", "name")
         name_label.setWordWrap(True)
-        apply_text_color(name_label, 'text_dark')
         layout.addWidget(name_label)
         
         # Дата (если указана)
         if 'date' in self.bid_data:
             date_label = QLabel(self.bid_data['date'])
-            apply_label_style(date_label, 'small')
-            apply_text_color(date_label, 'text_light')
+            date_label.setProperty("role", "date")
             layout.addWidget(date_label)
         
         # Сумма (если указана)
         if 'amount' in self.bid_data:
             amount_label = QLabel(f"Сумма: {self.bid_data['amount']}")
-            apply_label_style(amount_label, 'small')
-            apply_text_color(amount_label, 'text_dark')
-            apply_font_weight(amount_label)
+            amount_label.setProperty("role", "amount")
             layout.addWidget(amount_label)
         
         layout.addStretch()
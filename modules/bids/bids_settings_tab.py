@@ -335,13 +335,18 @@ class BidsSettingsTab(QWidget):
             btn_remove = QPushButton("✕")
             btn_remove.setFixedSize(30, 30)
             apply_button_style(btn_remove, 'icon')
-            btn_remove.clicked.connect(
-                lambda checked, okpd_id=okpd['id']: self.handle_remove_okpd(okpd_id)
-            )
+            btn_remove.setProperty("okpdId", okpd['id'])
+            btn_remove.clicked.connect(self._on_remove_okpd_clicked)
             okpd_item_layout.addWidget(btn_remove)
             
             self.added_okpd_layout.addWidget(okpd_frame)
     
+    def _on_remove_okpd_clicked(self):
+        """Общий слот кнопок удаления: ID кода ОКПД хранится в свойстве кнопки"""
+        okpd_id = self.sender().property("okpdId")
+        if okpd_id is not None:
+            self.handle_remove_okpd(okpd_id)
+    
     def handle_remove_okpd(self, okpd_id: int):
         """Обработка удаления ОКПД"""
         self.okpd_manager.remove_okpd(okpd_id, self.parent_widget)
@@ -18,85 +18,82 @@ from services.document_search.document_downloader import DocumentDownloader
 class DocumentDownloadThread(QThread):
     """Поток для асинхронного скачивания документов"""
     
-    progress_updated = pyqtSignal(int, int, str)  # current, total, file_name
-    finished = pyqtSignal(int, int, Path)  # downloaded_count, total_count, download_dir
+    progress_updated = pyqtSignal(int, int, str)  # processed, total, file_name
+    # Не переопределяет QThread.finished: тот нужен для освобождения потока (deleteLater)
+    download_finished = pyqtSignal(int, int, Path)  # downloaded_count, total_count, download_dir
     error_occurred = pyqtSignal(str)  # error_message
     
-    def __init__(self, document_links: List[Dict[str, Any]], download_dir: Path, tender_data: Dict[str, Any]):
+    def __init__(
+        self,
+        document_links: List[Dict[str, Any]],
+        download_dir: Path,
+        tender_id: Optional[int],
+        registry_type: str,
+        max_workers: int = 8,
+    ):
         super().__init__()
         self.document_links = document_links
         self.download_dir = download_dir
-        self.tender_data = tender_data
+        # Из данных закупки нужны только ID и тип реестра (для имени папки)
+        self.tender_id = tender_id
+        self.registry_type = registry_type
+        self.max_workers = max(1, max_workers)
+        # Путь к папке закупки вычисляется в GUI-потоке до start()
+        folder_name = f"{registry_type}_{tender_id}" if tender_id else "tender_temp"
+        self.tender_folder = download_dir / folder_name
     
     def run(self):
         """Выполнение скачивания документов"""
         try:
-            registry_type = self._determine_registry_type()
-            tender_id = self.tender_data.get('id')
+            tender_folder = self.tender_folder
+            # Список документов со ссылками вычисляется один раз на всё скачивание
+            eligible_docs = [doc for doc in self.document_links if doc.get('document_links')]
+            # Потоков не больше, чем документов
+            max_workers = max(1, min(self.max_workers, len(eligible_docs)))
+            # Папка закупки создается один раз (в конструкторе загрузчика),
+            # документы сохраняются в его download_dir без повторных mkdir
+            downloader = DocumentDownloader(tender_folder, pool_size=max_workers)
             
-            if tender_id:
-                folder_name = f"{registry_type}_{tender_id}"
-            else:
-                folder_name = "tender_temp"
-            
-            tender_folder = self.download_dir / folder_name
-            tender_folder.mkdir(parents=True, exist_ok=True)
-            
-            downloader = DocumentDownloader(tender_folder)
-            
-            total_docs = len(self.document_links)
+            # Документы без ссылки не скачиваются и в общее количество не входят,
+            # чтобы прогресс доходил до конца
+            total_docs = len(eligible_docs)
             downloaded_count = 0
-            batch_size = 8
             
-            for start_idx in range(0, total_docs, batch_size):
-                end_idx = min(start_idx + batch_size, total_docs)
-                batch = self.document_links[start_idx:end_idx]
-                
-                logger.info(f"Скачивание документов {start_idx + 1}-{end_idx} из {total_docs} (параллельно)")
+            logger.info(f"Скачивание документов: {total_docs} (параллельно)")
+            
+            # Все документы ставятся в очередь сразу и обрабатываются по мере готовности:
+            # медленный файл не задерживает запуск следующих (без порций по 8)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                future_to_doc = {
+                    executor.submit(self._download_single_document, downloader, doc): doc
+                    for doc in eligible_docs
+                }
                 
-                with ThreadPoolExecutor(max_workers=min(batch_size, len(batch))) as executor:
-                    future_to_doc = {
-                        executor.submit(self._download_single_document, downloader, doc, tender_folder): doc
-                        for doc in batch
-                        if doc.get('document_links')
-                    }
-                    
-                    for future in as_completed(future_to_doc):
-                        doc = future_to_doc[future]
-                        file_name = doc.get('file_name', 'Документ')
-                        try:
-                            downloaded_path = future.result()
-                            if downloaded_path:
-                                downloaded_count += 1
-                                self.progress_updated.emit(downloaded_count, total_docs, file_name)
-                                logger.info(f"✅ Скачан: {file_name}")
-                        except Exception as error:
-                            logger.error(f"❌ Ошибка при скачивании {file_name}: {error}")
-                            continue
+                # Прогресс считается по обработанным документам (включая неудачные),
+                # поэтому он обновляется сразу после завершения каждого скачивания
+                # и доходит до конца даже при ошибках
+                for processed, future in enumerate(as_completed(future_to_doc), 1):
+                    doc = future_to_doc[future]
+                    file_name = doc.get('file_name', 'Документ')
+                    try:
+                        if future.result():
+                            downloaded_count += 1
+                            logger.info(f"✅ Скачан: {file_name}")
+                    except Exception as error:
+                        logger.error(f"❌ Ошибка при скачивании {file_name}: {error}")
+                    logger.info(f"Скачивание: {processed}/{total_docs} - {file_name}")
+                    self.progress_updated.emit(processed, total_docs, file_name)
             
-            self.finished.emit(downloaded_count, total_docs, tender_folder)
+            self.download_finished.emit(downloaded_count, total_docs, tender_folder)
             
         except Exception as error:
             logger.error(f"Критическая ошибка при скачивании документов: {error}")
             self.error_occurred.emit(f"Ошибка при скачивании документов: {str(error)}")
     
-    def _download_single_document(self, downloader: DocumentDownloader, doc: Dict[str, Any], target_dir: Path) -> Optional[Path]:
-        """Скачивание одного документа"""
+    def _download_single_document(self, downloader: DocumentDownloader, doc: Dict[str, Any]) -> Optional[Path]:
+        """Скачивание одного документа в папку закупки"""
         try:
-            return downloader.download_document(doc, target_dir=target_dir)
+            return downloader.download_document(doc)
         except Exception as error:
             logger.error(f"Ошибка при скачивании документа: {error}")
             return None
-    
-    def _determine_registry_type(self) -> str:
-        """Определяет тип реестра (44ФЗ/223ФЗ)"""
-        raw_value = (
-            self.tender_data.get('registry_type')
-            or self.tender_data.get('law')
-            or ''
-        )
-        value = str(raw_value).lower()
-        if '223' in value:
-            return '223fz'
-        return '44fz'
-
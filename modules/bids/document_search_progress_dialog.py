@@ -2,7 +2,9 @@
 Диалоговое окно с прогресс-баром для отображения процесса поиска по документации
 """
 
-from PyQt5.QtWidgets import QDialog, QVBoxLayout, QLabel, QProgressBar, QPushButton
+import time
+
+from PyQt5.QtWidgets import QApplication, QDialog, QVBoxLayout, QLabel, QProgressBar, QPushButton
 from PyQt5.QtCore import Qt, pyqtSignal, QThread
 from typing import Optional
 from loguru import logger
@@ -27,11 +29,17 @@ class DocumentSearchProgressDialog(QDialog):
     
     cancelled = pyqtSignal()  # Сигнал отмены операции
     
+    # Не чаще одного принудительного цикла обработки событий за этот интервал (сек)
+    PROCESS_EVENTS_INTERVAL = 0.05
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         configure_dialog(self, "Поиск по документации", size_preset="progress_dialog")
         self.setModal(True)
         self._cancelled = False
+        # Последнее показанное состояние (этап, прогресс, детали) и время processEvents
+        self._last_state = None
+        self._last_events_time = 0.0
         self.init_ui()
     
     def init_ui(self):
@@ -100,6 +108,12 @@ class DocumentSearchProgressDialog(QDialog):
         # Ограничиваем прогресс в диапазоне 0-100
         progress = max(0, min(100, progress))
         
+        # Повтор того же состояния не перерисовывает диалог
+        state = (stage_name, progress, detail or "")
+        if state == self._last_state:
+            return
+        self._last_state = state
+        
         logger.debug(f"Диалог прогресса: {stage_name} - {progress}% - {detail or ''}")
         
         self.stage_label.setText(stage_name)
@@ -110,9 +124,12 @@ class DocumentSearchProgressDialog(QDialog):
         else:
             self.detail_label.setText("")
         
-        # Обновляем интерфейс (обрабатываем события для обновления UI)
-        from PyQt5.QtWidgets import QApplication
-        QApplication.processEvents()
+        # Обновляем интерфейс (обрабатываем события для обновления UI), но не на
+        # каждый вызов: частые обновления иначе перерисовывают диалог без пауз
+        now = time.monotonic()
+        if now - self._last_events_time >= self.PROCESS_EVENTS_INTERVAL:
+            self._last_events_time = now
+            QApplication.processEvents()
     
     def set_download_progress(self, current: int, total: int, file_name: Optional[str] = None):
         """
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from itertools import islice
 from pathlib import Path
 from typing import Dict, List
 
@@ -19,11 +20,9 @@ from loguru import logger
 
 from modules.styles.general_styles import (
     apply_button_style,
-    apply_frame_style,
     apply_label_style,
     COLORS,
     apply_text_style_light,
-    apply_font_weight,
 )
 from modules.styles.ui_config import configure_dialog
 from services.archive_processing_service import ArchiveProcessingService
@@ -32,6 +31,9 @@ from services.archive_processing_service import ArchiveProcessingService
 class DocumentSearchResultDialog(QDialog):
     """Диалоговое окно с результатами поиска по документации."""
 
+    # Сколько совпадений группы показывается карточками (остальные - одной строкой)
+    GROUP_DISPLAY_LIMIT = 20
+
     def __init__(
         self,
         parent,
@@ -128,7 +130,8 @@ class DocumentSearchResultDialog(QDialog):
         apply_label_style(group_label, "h2")
         parent_layout.addWidget(group_label)
 
-        for match in matches:
+        # Фрагменты (build_display_chunks) строятся только для показываемых совпадений
+        for match in islice(matches, self.GROUP_DISPLAY_LIMIT):
             try:
                 # Проверяем обязательные поля
                 if not isinstance(match, dict):
@@ -152,21 +155,22 @@ class DocumentSearchResultDialog(QDialog):
                         "cell_text": ""
                     }
                 
+                # Оформление рамки и меток задается общей таблицей стилей
+                # (DOCUMENT_SEARCH_RESULT_STYLE) по свойству resultRole
                 frame = QFrame()
-                apply_frame_style(frame, "content")
+                frame.setProperty("resultRole", "match")
                 frame_layout = QVBoxLayout(frame)
                 frame_layout.setSpacing(6)
 
                 header = QLabel(f"{product_name} • {score:.1f}%")
                 header.setTextInteractionFlags(Qt.TextSelectableByMouse)
-                apply_label_style(header, "normal")
-                apply_font_weight(header)
+                header.setProperty("resultRole", "header")
                 frame_layout.addWidget(header)
 
                 file_info = chunk.get("file_info", "Информация о файле недоступна")
                 file_label = QLabel(file_info)
                 file_label.setTextInteractionFlags(Qt.TextSelectableByMouse)
-                apply_label_style(file_label, "small")
+                file_label.setProperty("resultRole", "small")
                 frame_layout.addWidget(file_label)
 
                 summary = chunk.get("summary", "")
@@ -174,14 +178,14 @@ class DocumentSearchResultDialog(QDialog):
                     summary_label = QLabel(summary)
                     summary_label.setWordWrap(True)
                     summary_label.setTextInteractionFlags(Qt.TextSelectableByMouse)
-                    apply_label_style(summary_label, "normal")
+                    summary_label.setProperty("resultRole", "normal")
                     frame_layout.addWidget(summary_label)
 
                 cell_text = chunk.get("cell_text", "")
                 text_label = QLabel(cell_text)
                 text_label.setWordWrap(True)
                 text_label.setTextInteractionFlags(Qt.TextSelectableByMouse)
-                apply_label_style(text_label, "small")
+                text_label.setProperty("resultRole", "small")
                 frame_layout.addWidget(text_label)
 
                 parent_layout.addWidget(frame)
@@ -190,6 +194,13 @@ class DocumentSearchResultDialog(QDialog):
                 # Продолжаем обработку следующих совпадений
                 continue
 
+        hidden_count = len(matches) - self.GROUP_DISPLAY_LIMIT
+        if hidden_count > 0:
+            more_label = QLabel(f"… и еще совпадений: {hidden_count}")
+            apply_label_style(more_label, "small")
+            apply_text_style_light(more_label)
+            parent_layout.addWidget(more_label)
+
     def _handle_open_folder(self) -> None:
         if self.tender_folder and Path(self.tender_folder).exists():
             QDesktopServices.openUrl(QUrl.fromLocalFile(str(self.tender_folder)))
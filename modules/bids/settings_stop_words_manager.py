@@ -45,28 +45,30 @@ class StopWordsManager:
                 QMessageBox.warning(parent_widget, "Предупреждение", "Не удалось извлечь стоп-слова из введенного текста")
             return
         
-        # Проверяем, какие слова уже существуют в БД
+        # Проверяем, какие слова уже существуют в БД (один проход по словам)
         existing_words = []
+        new_words = []
         all_stop_words = self.tender_repo.get_user_stop_words(self.user_id)
         existing_words_set = {sw.get('stop_word', '').lower() for sw in all_stop_words}
-        
+
         for word in words:
             if word.lower() in existing_words_set:
                 existing_words.append(word)
-        
+            else:
+                new_words.append(word)
+
         # Если все слова уже существуют, показываем предупреждение
-        if len(existing_words) == len(words):
+        if not new_words:
             existing_text = ", ".join(existing_words)
             QMessageBox.warning(
-                parent_widget, 
-                "Слово уже добавлено", 
+                parent_widget,
+                "Слово уже добавлено",
                 f"Все введенные слова уже используются:\n{existing_text}"
             )
             return
-        
+
         # Показываем предупреждение, если некоторые слова уже существуют
-        new_words = [w for w in words if w.lower() not in existing_words_set]
-        if existing_words and new_words:
+        if existing_words:
             existing_text = ", ".join(existing_words)
             QMessageBox.warning(
                 parent_widget,
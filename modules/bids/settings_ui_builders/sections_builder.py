@@ -4,9 +4,12 @@ UI билдер для всех секций настроек закупок.
 Создает секции: фильтр категорий, ОКПД, категории, стоп-слова, документ стоп-фразы, кнопка показа.
 """
 
-from PyQt5.QtWidgets import QVBoxLayout, QHBoxLayout, QComboBox, QLineEdit, QWidget
+from PyQt5.QtWidgets import (
+    QVBoxLayout, QHBoxLayout, QComboBox, QLineEdit, QWidget, QLabel, QScrollArea
+)
 from PyQt5.QtCore import Qt
 
+from modules.styles.general_styles import FONT_SIZES, COLORS, SIZES
 from modules.bids.salesforce_settings_ui import (
     create_salesforce_section_card, create_salesforce_input_row,
     create_salesforce_button, create_salesforce_list_widget
@@ -80,9 +83,6 @@ class SettingsSectionsBuilder:
         card_layout.addLayout(search_row)
         
         # Список результатов
-        from modules.styles.general_styles import FONT_SIZES, COLORS
-        from PyQt5.QtWidgets import QLabel
-        
         results_label = QLabel("Доступные коды ОКПД:")
         results_label.setStyleSheet(f"font-size: {FONT_SIZES['normal']}; font-weight: 600; color: {COLORS['text_dark']};")
         card_layout.addWidget(results_label)
@@ -111,9 +111,6 @@ class SettingsSectionsBuilder:
         card_layout = card.layout()
         
         # Список категорий и кнопки управления
-        from PyQt5.QtWidgets import QLabel
-        from modules.styles.general_styles import FONT_SIZES, COLORS
-        
         categories_label = QLabel("Ваши категории:")
         categories_label.setStyleSheet(f"font-size: {FONT_SIZES['normal']}; font-weight: 600; color: {COLORS['text_dark']};")
         card_layout.addWidget(categories_label)
@@ -155,9 +152,6 @@ class SettingsSectionsBuilder:
     @staticmethod
     def build_added_okpd_section(parent_layout: QVBoxLayout) -> dict:
         """Создание секции добавленных ОКПД."""
-        from PyQt5.QtWidgets import QScrollArea
-        from modules.styles.general_styles import COLORS, SIZES
-        
         card = create_salesforce_section_card(
             title="✅ Добавленные ОКПД",
             description="Список ОКПД кодов, которые используются для поиска закупок. Вы можете назначить категорию или удалить код."
@@ -196,9 +190,6 @@ class SettingsSectionsBuilder:
     @staticmethod
     def build_stop_words_section(parent_layout: QVBoxLayout) -> dict:
         """Создание секции стоп-слов."""
-        from PyQt5.QtWidgets import QScrollArea
-        from modules.styles.general_styles import FONT_SIZES, COLORS, SIZES
-        
         card = create_salesforce_section_card(
             title="🚫 Стоп-слова",
             description="Закупки, содержащие эти слова в названии, будут исключены из результатов."
@@ -219,7 +210,6 @@ class SettingsSectionsBuilder:
         card_layout.addLayout(add_layout)
         
         # Контейнер для стоп-слов (используется в load_user_stop_words)
-        from PyQt5.QtWidgets import QLabel
         stopwords_label = QLabel("Активные стоп-слова:")
         stopwords_label.setStyleSheet(f"font-size: {FONT_SIZES['normal']}; font-weight: 600; color: {COLORS['text_dark']};")
         card_layout.addWidget(stopwords_label)
@@ -257,9 +247,6 @@ class SettingsSectionsBuilder:
     @staticmethod
     def build_document_stop_phrases_section(parent_layout: QVBoxLayout) -> dict:
         """Создание секции стоп-фраз для документов."""
-        from PyQt5.QtWidgets import QScrollArea
-        from modules.styles.general_styles import FONT_SIZES, COLORS, SIZES
-        
         card = create_salesforce_section_card(
             title="📄 Стоп-фразы документации",
             description="Фразы для исключения закупок при анализе документации."
@@ -280,7 +267,6 @@ class SettingsSectionsBuilder:
         card_layout.addLayout(add_layout)
         
         # Контейнер для стоп-фраз (используется в load_document_stop_phrases)
-        from PyQt5.QtWidgets import QLabel
         phrases_label = QLabel("Активные стоп-фразы:")
         phrases_label.setStyleSheet(f"font-size: {FONT_SIZES['normal']}; font-weight: 600; color: {COLORS['text_dark']};")
         card_layout.addWidget(phrases_label)
@@ -318,8 +304,6 @@ class SettingsSectionsBuilder:
     @staticmethod
     def build_show_tenders_section(parent_layout: QVBoxLayout) -> dict:
         """Создание секции кнопок применения настроек."""
-        from modules.bids.salesforce_settings_ui import create_salesforce_button
-        
         card = create_salesforce_section_card(
             title="🎯 Применить настройки",
             description="Обновите данные или сохраните настройки для постоянного использования."
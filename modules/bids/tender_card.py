@@ -1,12 +1,24 @@
 """Виджет карточки закупки (сокращенный и полный вид)"""
 
-from PyQt5.QtWidgets import QFrame, QVBoxLayout, QHBoxLayout, QLabel, QCheckBox, QWidget
-from PyQt5.QtCore import Qt, pyqtSignal
+from PyQt5.QtWidgets import QApplication, QFrame, QLabel, QCheckBox, QMessageBox, QWidget
+from PyQt5.QtCore import QTimer, pyqtSignal, pyqtSlot
 from typing import Dict, Any, Optional, TYPE_CHECKING, List
 import traceback
 from loguru import logger
-from modules.styles.bids_styles import apply_tender_card_style, apply_tender_checkbox_style
-from modules.bids.tender_detail_dialog import TenderDetailDialog
+from modules.bids.tender_detail_dialog import get_tender_detail_dialog
+from modules.bids.tender_card_data_fetch import (
+    MISS, naive_copy, fetch_match_summary_with_cache, fetch_match_details_with_cache
+)
+from modules.bids.tender_card_ui import (
+    create_card_grid, add_header_row, add_grid_row, finish_card_grid,
+    create_info_widgets, create_price_date_widgets, create_meta_widgets,
+    create_okpd_label, place_wide_widget
+)
+from modules.bids.tender_card_status_preview import add_status_row
+from modules.bids.tender_card_update import update_card_status
+from modules.bids.tender_matches_preview import create_matches_preview
+from modules.bids.tender_registry_type import determine_registry_type
+from modules.bids.tender_status_badges import create_status_badges
 
 if TYPE_CHECKING:
     from services.document_search_service import DocumentSearchService
@@ -23,15 +35,23 @@ class TenderCard(QFrame):
         document_search_service: Optional['DocumentSearchService'] = None,
         tender_match_repository: Optional['TenderMatchRepository'] = None,
         parent=None,
+        initial_match_summary: Any = MISS,
     ):
         super().__init__(parent)
         self.tender_data = tender_data or {}
         self.document_search_service = document_search_service
         self.tender_match_repository = tender_match_repository
         self._registry_type = self._determine_registry_type()
-        self._match_summary_cache: Optional[Dict[str, Any]] = None
-        self._match_details_cache: Optional[List[Dict[str, Any]]] = None
+        # Сводка может быть заранее загружена списком одним батч-запросом
+        # MISS - ещё не запрашивали; None - запрашивали, записи нет
+        self._match_summary_cache: Any = initial_match_summary
         self.matches_preview: Optional[QWidget] = None
+        self.status_container: Optional[QWidget] = None
+        # Строки сетки карточки для значков статуса и превью совпадений
+        self._status_row = 0
+        self._preview_row = 0
+        # Превью совпадений строится при первой отрисовке карточки
+        self._matches_built = False
         self.is_selected = False
         self._detail_dialog = None  # Защита от повторного открытия
         try:
@@ -45,37 +65,79 @@ class TenderCard(QFrame):
     
     def init_ui(self):
         """Инициализация интерфейса карточки"""
-        from modules.bids.tender_card_ui import (
-            create_header_layout, create_info_layout,
-            create_price_date_layout, create_meta_layout, create_okpd_label
-        )
-        
-        layout = QVBoxLayout(self)
-        layout.setSpacing(8)
-        layout.setContentsMargins(12, 12, 12, 12)
-        apply_tender_card_style(self)
+        # Без промежуточных перерисовок, пока добавляются дочерние виджеты
+        self.setUpdatesEnabled(False)
+        try:
+            # Одна сетка вместо вложенных горизонтальных layout на каждую строку
+            grid = create_card_grid(self)
+            # Стили карточки, чекбокса и значков задаются общей таблицей стилей
+            # приложения (install_tender_card_styles)
+            self.setObjectName("TenderCard")
         
-        self.select_checkbox = QCheckBox()
-        apply_tender_checkbox_style(self.select_checkbox)
-        self.select_checkbox.stateChanged.connect(self._on_selection_changed)
+            self.select_checkbox = QCheckBox()
+            self.select_checkbox.toggled.connect(self._on_selection_changed)
         
-        layout.addLayout(create_header_layout(self.tender_data, self.select_checkbox))
-        layout.addLayout(create_info_layout(self.tender_data))
-        layout.addLayout(create_price_date_layout(self.tender_data))
+            add_header_row(grid, self.tender_data, self.select_checkbox)
+            add_grid_row(grid, create_info_widgets(self.tender_data))
+            add_grid_row(grid, create_price_date_widgets(self.tender_data))
+            add_grid_row(grid, create_meta_widgets(self.tender_data))
         
-        meta_layout = create_meta_layout(self.tender_data)
-        if meta_layout:
-            layout.addLayout(meta_layout)
+            okpd_label = create_okpd_label(self.tender_data)
+            if okpd_label:
+                add_grid_row(grid, [okpd_label])
         
-        okpd_label = create_okpd_label(self.tender_data)
-        if okpd_label:
-            layout.addWidget(okpd_label)
+            self._status_row = grid.rowCount()
+            self._preview_row = self._status_row + 1
+            # Без заранее загруженной сводки значки потребовали бы запроса в БД:
+            # он откладывается до первой отрисовки, как и превью совпадений
+            if self._match_summary_cache is not MISS:
+                self.status_container = add_status_row(
+                    grid, self._status_row, self._create_status_badges
+                )
+            finish_card_grid(grid)
+        finally:
+            self.setUpdatesEnabled(True)
+    
+    def rebind(self, tender_data: Dict[str, Any], initial_match_summary: Any = MISS) -> None:
+        """
+        Повторное использование карточки из пула для другой закупки.
         
-        from modules.bids.tender_card_status_preview import add_status_and_preview
-        self.status_container, self.matches_preview = add_status_and_preview(
-            layout, self._create_status_badges, self._create_matches_preview
-        )
-        self.setMouseTracking(True)
+        Сохраняются сама карточка и подключения ее сигналов; содержимое
+        сетки строится заново, так как набор строк зависит от данных закупки.
+        """
+        self.tender_data = tender_data or {}
+        self._registry_type = self._determine_registry_type()
+        self._match_summary_cache = initial_match_summary
+        self.matches_preview = None
+        self.status_container = None
+        self._matches_built = False
+        self.is_selected = False
+        self._detail_dialog = None
+        layout = self.layout()
+        if layout is not None:
+            # Сетка вместе с дочерними виджетами удаляется временным виджетом
+            QWidget().setLayout(layout)
+        self.init_ui()
+    
+    def paintEvent(self, event):
+        """Первая отрисовка - карточка попала в видимую область, строим превью"""
+        super().paintEvent(event)
+        if not self._matches_built:
+            self._matches_built = True
+            # Менять layout внутри paintEvent нельзя - откладываем до цикла событий
+            QTimer.singleShot(0, self._build_matches_preview)
+    
+    def _build_matches_preview(self):
+        # Отложенный вызов мог остаться от прежних данных карточки из пула
+        if self.matches_preview is not None:
+            return
+        if self.status_container is None:
+            self.status_container = add_status_row(
+                self.layout(), self._status_row, self._create_status_badges
+            )
+        self.matches_preview = self._create_matches_preview()
+        if self.matches_preview:
+            place_wide_widget(self.layout(), self.matches_preview, self._preview_row)
     
     def mouseDoubleClickEvent(self, event):
         """Обработка двойного клика - открытие полной информации"""
@@ -95,7 +157,6 @@ class TenderCard(QFrame):
         # Проверяем валидность данных
         if not self.tender_data or not self.tender_data.get('id'):
             logger.error("Не удалось открыть диалог: отсутствуют данные о закупке")
-            from PyQt5.QtWidgets import QMessageBox
             QMessageBox.warning(
                 self,
                 "Ошибка",
@@ -105,18 +166,18 @@ class TenderCard(QFrame):
         
         try:
             # Копируем данные, чтобы избежать проблем с изменением во время работы диалога
-            import copy
-            tender_data_copy = copy.deepcopy(self.tender_data)
-            match_summary_copy = copy.deepcopy(self._match_summary_cache) if self._match_summary_cache else None
-            match_details_copy = copy.deepcopy(self._match_details_cache) if self._match_details_cache else None
+            tender_data_copy = naive_copy(self.tender_data)
+            match_summary = self._cached_or_none(self._match_summary_cache)
+            match_details = self._fetch_match_details() if match_summary else None
+            match_summary_copy = naive_copy(match_summary) if match_summary else None
+            match_details_copy = naive_copy(match_details) if match_details else None
             
             # Получаем правильный parent (окно приложения)
             parent_window = self.window()
             if parent_window is None:
-                from PyQt5.QtWidgets import QApplication
                 parent_window = QApplication.activeWindow()
             
-            dialog = TenderDetailDialog(
+            dialog = get_tender_detail_dialog(
                 tender_data_copy,
                 document_search_service=self.document_search_service,
                 tender_match_repository=self.tender_match_repository,
@@ -125,65 +186,77 @@ class TenderCard(QFrame):
                 initial_match_details=match_details_copy,
                 parent=parent_window,
             )
+            # Диалог общий для карточек: ссылка сбрасывается после закрытия,
+            # а не обработчиком finished, который копился бы у диалога
             self._detail_dialog = dialog
-            dialog.finished.connect(lambda: setattr(self, '_detail_dialog', None))
-            dialog.exec_()
+            try:
+                dialog.exec_()
+            finally:
+                self._detail_dialog = None
         except Exception as e:
             logger.error(
                 f"Ошибка при открытии диалога деталей закупки ID {self.tender_data.get('id', 'неизвестно')}: {e}",
                 exc_info=True,
             )
-            from PyQt5.QtWidgets import QMessageBox
             QMessageBox.critical(
                 self,
                 "Ошибка",
-                f"Не удалось открыть информацию о закупке:\n{str(e)}"
+                f"Не удалось открыть информацию о закупке:\n{e}"
             )
             self._detail_dialog = None
     
     def _create_status_badges(self) -> Optional[QWidget]:
-        from modules.bids.tender_status_badges import create_status_badges
         return create_status_badges(self._fetch_match_summary(), self)
     
     def _create_matches_preview(self) -> Optional[QWidget]:
-        from modules.bids.tender_matches_preview import create_matches_preview
-        return create_matches_preview(self._fetch_match_summary(), self._fetch_match_details)
+        # Необработанная закупка (сводки нет) - превью не нужно
+        summary = self._fetch_match_summary()
+        if not summary:
+            return None
+        return create_matches_preview(summary, self._fetch_match_details)
     
     def _fetch_match_summary(self) -> Optional[Dict[str, Any]]:
-        from modules.bids.tender_card_data_fetch import fetch_match_summary_with_cache
         tender_id = self.tender_data.get('id')
-        if self._match_summary_cache is None:
+        if self._match_summary_cache is MISS:
             self._match_summary_cache = fetch_match_summary_with_cache(
                 self.tender_match_repository, tender_id, self._registry_type, None
             )
         return self._match_summary_cache
     
     def _fetch_match_details(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
-        from modules.bids.tender_card_data_fetch import fetch_match_details_with_cache
-        tender_id = self.tender_data.get('id')
-        if self._match_details_cache is None and self._fetch_match_summary():
-            self._match_details_cache = fetch_match_details_with_cache(
-                self.tender_match_repository, tender_id, self._registry_type, None, self.MATCH_DETAILS_CACHE_LIMIT
-            )
-        return fetch_match_details_with_cache(
-            self.tender_match_repository, tender_id, self._registry_type,
-            self._match_details_cache, self.MATCH_DETAILS_CACHE_LIMIT, limit
+        # Детали кэширует репозиторий (общий LRU на весь список), карточка их не хранит
+        if not self._fetch_match_summary():
+            return []
+        details = fetch_match_details_with_cache(
+            self.tender_match_repository, self.tender_data.get('id'), self._registry_type,
+            None, self.MATCH_DETAILS_CACHE_LIMIT
         )
+        return details[:limit] if limit else details
+    
+    @staticmethod
+    def _cached_or_none(value: Any) -> Any:
+        return None if value is MISS else value
     
-    def update_status(self):
-        from modules.bids.tender_card_update import update_card_status
-        update_card_status(self, self._create_status_badges, self._create_matches_preview)
+    def update_status(self, match_summary: Any = MISS):
+        update_card_status(
+            self, self._create_status_badges, self._create_matches_preview, match_summary
+        )
     
-    def _on_selection_changed(self, state: int):
-        self.is_selected = (state == Qt.Checked)
-        self.selection_changed.emit(self.is_selected)
+    @pyqtSlot(bool)
+    def _on_selection_changed(self, checked: bool):
+        self.is_selected = checked
+        self.selection_changed.emit(checked)
     
     def set_selected(self, selected: bool):
         if hasattr(self, 'select_checkbox'):
-            self.select_checkbox.setChecked(selected)
+            # Программная установка не должна вызывать toggled и повторную отправку сигнала
+            self.select_checkbox.blockSignals(True)
+            try:
+                self.select_checkbox.setChecked(selected)
+            finally:
+                self.select_checkbox.blockSignals(False)
             self.is_selected = selected
     
     def _determine_registry_type(self) -> str:
-        from modules.bids.tender_registry_type import determine_registry_type
         return determine_registry_type(self.tender_data)
 
@@ -5,6 +5,25 @@ from typing import Any, Dict, List, Optional, TYPE_CHECKING
 if TYPE_CHECKING:
     from services.tender_match_repository import TenderMatchRepository
 
+# Маркер «ещё не загружено»: None в кэше означает, что данных в БД нет
+MISS = object()
+
+
+def naive_copy(value: Any) -> Any:
+    """
+    Копия данных закупки или совпадений для диалога деталей.
+
+    Данные из БД - словари и списки со строками, числами, Decimal и датами,
+    поэтому копируются только контейнеры; неизменяемые значения переиспользуются.
+    Быстрее copy.deepcopy: без memo-словаря и диспетчеризации по типам.
+    Строки psycopg2 (RealDictRow) копируются в обычные словари.
+    """
+    if isinstance(value, dict):
+        return {key: naive_copy(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [naive_copy(item) for item in value]
+    return value
+
 
 def fetch_match_summary_with_cache(
     tender_match_repository: Optional['TenderMatchRepository'],
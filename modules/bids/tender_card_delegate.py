@@ -0,0 +1,340 @@
+"""
+Модель и делегат для отображения карточек закупок в QListView.
+
+Для длинных списков карточка рисуется делегатом через QPainter вместо
+дерева QLabel/QHBoxLayout на каждую закупку. Интерактивны только флажок
+выбора и ссылка на закупку (обрабатываются в editorEvent).
+TenderCard остается для одиночного отображения.
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+from PyQt5.QtCore import (
+    QAbstractListModel, QEvent, QModelIndex, QRect, QSize, Qt, QUrl
+)
+from PyQt5.QtGui import QColor, QDesktopServices, QFont, QFontMetrics, QPainter, QPen
+from PyQt5.QtWidgets import (
+    QAbstractItemView, QApplication, QStyle, QStyledItemDelegate, QStyleOptionButton, QStyleOptionViewItem
+)
+
+from modules.bids.tender_card_utils import (
+    customer_display_name, format_balance_holder, format_date_value, format_price_value, prefixed_text
+)
+from modules.bids.tender_registry_type import determine_registry_type
+from modules.bids.tender_status_badges import BADGE_SLOTS, describe_status
+from modules.styles.bids_styles import STATUS_BADGE_COLORS, TENDER_CARD_STATUS_COLORS
+from modules.styles.general_styles import COLORS, SIZES, get_font
+
+
+def _qcolor_pairs(colors: Dict[str, Tuple[str, str]]) -> Dict[str, Tuple[QColor, QColor]]:
+    return {key: (QColor(first), QColor(second)) for key, (first, second) in colors.items()}
+
+
+# Цвета отрисовки создаются один раз при импорте, а не в каждом вызове paint
+_CARD_COLORS = _qcolor_pairs(TENDER_CARD_STATUS_COLORS)
+_DEFAULT_CARD_COLORS = (QColor(COLORS['border']), QColor(COLORS['white']))
+_BADGE_COLORS = _qcolor_pairs(STATUS_BADGE_COLORS)
+_DEFAULT_BADGE_COLORS = (QColor(COLORS['text_dark']), QColor(COLORS['secondary']))
+_TEXT_DARK = QColor(COLORS['text_dark'])
+_TEXT_LIGHT = QColor(COLORS['text_light'])
+_PRIMARY = QColor(COLORS['primary'])
+
+
+TENDER_ROLE = Qt.UserRole + 1
+SUMMARY_ROLE = Qt.UserRole + 2
+LINES_ROLE = Qt.UserRole + 3
+URL_ROLE = Qt.UserRole + 4
+
+
+def card_text_lines(tender: Dict[str, Any]) -> Tuple[str, str, str]:
+    """Строки информации, цены/даты и мета-информации карточки"""
+    # Каждое поле читается один раз через связанный метод
+    get = tender.get
+    customer, _ = customer_display_name(tender)
+    contract_number = get('contract_number')
+    region = get('region_name') or get('delivery_region')
+    info = "   ".join(filter(None, (
+        f"№ {contract_number}" if contract_number else "",
+        prefixed_text("📍", region) if region else "",
+        prefixed_text("👤", customer) if customer else "",
+    )))
+    initial_price = get('initial_price')
+    price_str = format_price_value(initial_price) if initial_price else None
+    price = f"💰 {price_str} ₽" if price_str else ""
+    end_date = get('end_date')
+    date_str = format_date_value(end_date) if end_date else None
+    price_date = "   ".join(filter(None, (price, prefixed_text("📅 До", date_str) if date_str else "")))
+    platform_name = get('platform_name')
+    balance_holder = format_balance_holder(tender)
+    meta = "   ".join(filter(None, (
+        prefixed_text("🏛", platform_name) if platform_name else "",
+        prefixed_text("🏢 Балансодержатель:", balance_holder) if balance_holder else "",
+    )))
+    return info, price_date, meta
+
+
+class TenderListModel(QAbstractListModel):
+    """Модель списка закупок: данные закупки, сводка совпадений и флаг выбора"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._tenders: List[Dict[str, Any]] = []
+        self._summaries: Dict[tuple, Optional[Dict[str, Any]]] = {}
+        self._checked: set = set()
+        # Строки карточки по номеру строки: собираются при первой отрисовке
+        self._lines: Dict[int, Tuple[str, str, str]] = {}
+        # Разобранные ссылки на закупку по номеру строки: создаются при первом клике
+        self._urls: Dict[int, QUrl] = {}
+
+    def set_tenders(
+        self,
+        tenders: List[Dict[str, Any]],
+        summaries: Optional[Dict[tuple, Dict[str, Any]]] = None,
+    ) -> None:
+        """
+        Замена списка закупок.
+
+        Args:
+            tenders: Список закупок
+            summaries: Сводки {(tender_id, registry_type): summary} (см. get_match_summaries_batch)
+        """
+        self.beginResetModel()
+        self._tenders = list(tenders)
+        self._summaries = dict(summaries or {})
+        self._lines = {}
+        self._urls = {}
+        ids = {tender.get('id') for tender in self._tenders}
+        self._checked &= ids
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._tenders)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+        tender = self._tenders[index.row()]
+        if role == Qt.DisplayRole:
+            return tender.get('auction_name', 'Без названия')
+        if role == TENDER_ROLE:
+            return tender
+        if role == LINES_ROLE:
+            lines = self._lines.get(index.row())
+            if lines is None:
+                lines = self._lines[index.row()] = card_text_lines(tender)
+            return lines
+        if role == URL_ROLE:
+            url = self._urls.get(index.row())
+            if url is None and tender.get('tender_link'):
+                url = self._urls[index.row()] = QUrl(tender['tender_link'])
+            return url
+        if role == SUMMARY_ROLE:
+            return self._summaries.get((tender.get('id'), determine_registry_type(tender)))
+        if role == Qt.CheckStateRole:
+            return Qt.Checked if tender.get('id') in self._checked else Qt.Unchecked
+        return None
+
+    def setData(self, index: QModelIndex, value: Any, role: int = Qt.EditRole) -> bool:
+        if not index.isValid() or role != Qt.CheckStateRole:
+            return False
+        tender_id = self._tenders[index.row()].get('id')
+        if value == Qt.Checked:
+            self._checked.add(tender_id)
+        else:
+            self._checked.discard(tender_id)
+        self.dataChanged.emit(index, index, [Qt.CheckStateRole])
+        return True
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlags:
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsUserCheckable
+
+    def selected_tenders(self) -> List[Dict[str, Any]]:
+        """Закупки, отмеченные флажком"""
+        return [tender for tender in self._tenders if tender.get('id') in self._checked]
+
+
+class TenderCardDelegate(QStyledItemDelegate):
+    """Отрисовка карточки закупки через QPainter (без дочерних виджетов)"""
+
+    MARGIN = SIZES['padding_large']
+    SPACING = SIZES['padding_normal']
+    CHECKBOX_SIZE = int(SIZES['button_height'] * 0.8)
+    BADGE_PADDING = SIZES['padding_small']
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        base = QApplication.font()
+        # Название и цена - те же роли шрифта, что у меток TenderCard (общие QFont)
+        self._name_font = QFont(get_font('h2'))
+        self._name_font.setWeight(QFont.DemiBold)
+        self._text_font = QFont(base)
+        self._price_font = QFont(get_font('large'))
+        self._price_font.setBold(True)
+        self._link_font = QFont(base)
+        self._link_font.setUnderline(True)
+        # Метрики шрифтов вычисляются один раз
+        self._name_metrics = QFontMetrics(self._name_font)
+        self._text_metrics = QFontMetrics(self._text_font)
+        self._price_metrics = QFontMetrics(self._price_font)
+        self._size_cache: Dict[Tuple[Any, int], QSize] = {}
+        # Ширина, для которой заполнен кэш размеров
+        self._size_cache_width = 0
+
+    # --- Геометрия ---
+
+    def _name_rect(self, rect: QRect) -> QRect:
+        left = rect.left() + self.MARGIN + self.CHECKBOX_SIZE + self.SPACING
+        return QRect(left, rect.top() + self.MARGIN, rect.right() - self.MARGIN - left, 0)
+
+    def _checkbox_rect(self, rect: QRect) -> QRect:
+        return QRect(rect.left() + self.MARGIN, rect.top() + self.MARGIN, self.CHECKBOX_SIZE, self.CHECKBOX_SIZE)
+
+    def _name_height(self, name: str, width: int) -> int:
+        bounds = self._name_metrics.boundingRect(QRect(0, 0, max(width, 1), 0), Qt.TextWordWrap, name)
+        return max(bounds.height(), self.CHECKBOX_SIZE)
+
+    def _item_width(self, option: QStyleOptionViewItem) -> int:
+        """
+        Ширина карточки - ширина области просмотра списка.
+
+        option.rect в sizeHint QListView заполняет ненадежно (0 или прежняя
+        подсказка), а paint получает строку во всю ширину области просмотра.
+        """
+        view = self.parent()
+        if isinstance(view, QAbstractItemView):
+            return view.viewport().width()
+        return option.rect.width() or 600
+
+    def sizeHint(self, option: QStyleOptionViewItem, index: QModelIndex) -> QSize:
+        tender = index.data(TENDER_ROLE) or {}
+        width = self._item_width(option)
+        if width != self._size_cache_width:
+            self._size_cache.clear()
+            self._size_cache_width = width
+        key = (tender.get('id'), width)
+        if key not in self._size_cache:
+            name_width = self._name_rect(QRect(0, 0, width, 0)).width()
+            line = self._text_metrics.height() + self.SPACING
+            height = (
+                self.MARGIN * 2
+                + self._name_height(index.data(Qt.DisplayRole) or "", name_width) + self.SPACING
+                + line * 3  # информация, мета-информация, значки
+                + self._price_metrics.height() + self.SPACING
+                + (line if tender.get('tender_link') else 0)
+            )
+            self._size_cache[key] = QSize(width, height)
+        return self._size_cache[key]
+
+    # --- Отрисовка ---
+
+    def paint(self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex) -> None:
+        tender = index.data(TENDER_ROLE) or {}
+        status_variant, badges = describe_status(index.data(SUMMARY_ROLE))
+        rect = option.rect.adjusted(1, 1, -1, -self.SPACING)
+
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+
+        border, background = _CARD_COLORS.get(status_variant, _DEFAULT_CARD_COLORS)
+        if option.state & QStyle.State_MouseOver and not status_variant:
+            border = _PRIMARY
+        painter.setPen(QPen(border, 3 if status_variant else 1))
+        painter.setBrush(background)
+        radius = SIZES['border_radius_large']
+        painter.drawRoundedRect(rect, radius, radius)
+
+        checkbox = QStyleOptionButton()
+        checkbox.rect = self._checkbox_rect(rect)
+        checkbox.state = QStyle.State_Enabled | (
+            QStyle.State_On if index.data(Qt.CheckStateRole) == Qt.Checked else QStyle.State_Off
+        )
+        QApplication.style().drawPrimitive(QStyle.PE_IndicatorCheckBox, checkbox, painter)
+
+        name = index.data(Qt.DisplayRole) or ""
+        name_rect = self._name_rect(rect)
+        name_rect.setHeight(self._name_height(name, name_rect.width()))
+        painter.setPen(_TEXT_DARK)
+        painter.setFont(self._name_font)
+        painter.drawText(name_rect, Qt.TextWordWrap, name)
+
+        info, price_date, meta = index.data(LINES_ROLE)
+        left = rect.left() + self.MARGIN
+        width = rect.width() - self.MARGIN * 2
+        y = name_rect.top() + name_rect.height() + self.SPACING
+
+        painter.setFont(self._text_font)
+        painter.setPen(_TEXT_LIGHT)
+        line_height = self._text_metrics.height()
+        painter.drawText(QRect(left, y, width, line_height), Qt.AlignLeft, info)
+        y += line_height + self.SPACING
+
+        painter.setFont(self._price_font)
+        painter.setPen(_PRIMARY)
+        painter.drawText(QRect(left, y, width, self._price_metrics.height()), Qt.AlignLeft, price_date)
+        y += self._price_metrics.height() + self.SPACING
+
+        painter.setFont(self._text_font)
+        painter.setPen(_TEXT_LIGHT)
+        painter.drawText(QRect(left, y, width, line_height), Qt.AlignLeft, meta)
+        y += line_height + self.SPACING
+
+        if tender.get('tender_link'):
+            painter.setFont(self._link_font)
+            painter.setPen(_PRIMARY)
+            painter.drawText(self._link_rect(rect, y), Qt.AlignLeft, "Ссылка на закупку")
+            y += line_height + self.SPACING
+
+        self._paint_badges(painter, badges, left, y)
+        painter.restore()
+
+    def _link_rect(self, rect: QRect, y: int) -> QRect:
+        width = self._text_metrics.horizontalAdvance("Ссылка на закупку")
+        return QRect(rect.left() + self.MARGIN, y, width, self._text_metrics.height())
+
+    def _paint_badges(self, painter: QPainter, badges: Dict[str, Tuple[str, str, str]], x: int, y: int) -> None:
+        painter.setFont(self._text_font)
+        height = self._text_metrics.height()
+        for slot in BADGE_SLOTS:
+            if slot not in badges:
+                continue
+            text, variant, _tooltip = badges[slot]
+            color, background = _BADGE_COLORS.get(variant, _DEFAULT_BADGE_COLORS)
+            badge_rect = QRect(x, y, self._text_metrics.horizontalAdvance(text) + self.BADGE_PADDING * 2, height)
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(background)
+            painter.drawRoundedRect(badge_rect, self.BADGE_PADDING, self.BADGE_PADDING)
+            painter.setPen(color)
+            painter.drawText(badge_rect, Qt.AlignCenter, text)
+            x = badge_rect.right() + self.SPACING
+
+    # --- Взаимодействие ---
+
+    def editorEvent(self, event, model, option: QStyleOptionViewItem, index: QModelIndex) -> bool:
+        """Клик по флажку переключает выбор, клик по ссылке открывает закупку"""
+        if event.type() != QEvent.MouseButtonRelease or event.button() != Qt.LeftButton:
+            return super().editorEvent(event, model, option, index)
+
+        rect = option.rect.adjusted(1, 1, -1, -self.SPACING)
+        if self._checkbox_rect(rect).contains(event.pos()):
+            checked = index.data(Qt.CheckStateRole) == Qt.Checked
+            return model.setData(index, Qt.Unchecked if checked else Qt.Checked, Qt.CheckStateRole)
+
+        tender = index.data(TENDER_ROLE) or {}
+        if tender.get('tender_link'):
+            name_rect = self._name_rect(rect)
+            y = (
+                name_rect.top() + self._name_height(index.data(Qt.DisplayRole) or "", name_rect.width())
+                + self.SPACING + (self._text_metrics.height() + self.SPACING) * 2
+                + self._price_metrics.height() + self.SPACING
+            )
+            if self._link_rect(rect, y).contains(event.pos()):
+                QDesktopServices.openUrl(index.data(URL_ROLE))
+                return True
+        return super().editorEvent(event, model, option, index)
+
+    def clear_size_cache(self) -> None:
+        """Сброс кэша размеров (после замены данных модели)"""
+        self._size_cache.clear()
+        self._size_cache_width = 0
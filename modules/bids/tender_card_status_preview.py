@@ -1,21 +1,21 @@
-"""Модуль для создания статуса и превью совпадений в карточке закупки."""
+"""Модуль для создания строки статуса в карточке закупки."""
 
-from PyQt5.QtWidgets import QHBoxLayout
+from PyQt5.QtCore import Qt
 
+from modules.bids.tender_card_ui import place_wide_widget
 
-def add_status_and_preview(layout, create_status_func, create_preview_func):
-    """Добавляет статус и превью совпадений в layout"""
-    status_container = create_status_func()
-    status_layout = QHBoxLayout()
-    status_layout.setSpacing(10)
-    if status_container:
-        status_layout.addWidget(status_container)
-    status_layout.addStretch()
-    layout.addLayout(status_layout)
+
+def add_status_row(grid, row, create_status_func):
+    """
+    Добавляет значки статуса в строку row сетки карточки.
     
-    matches_preview = create_preview_func()
-    if matches_preview:
-        layout.addWidget(matches_preview)
+    Превью совпадений строится карточкой лениво, при первой отрисовке
+    (см. TenderCard.paintEvent), и размещается в следующей строке.
     
-    return status_container, matches_preview
-
+    Returns:
+        status_container - виджет значков статуса (или None)
+    """
+    status_container = create_status_func()
+    if status_container:
+        place_wide_widget(grid, status_container, row, Qt.AlignLeft)
+    return status_container
@@ -2,159 +2,161 @@
 Модуль для создания UI элементов карточки закупки.
 """
 
-from PyQt5.QtWidgets import QHBoxLayout, QLabel, QVBoxLayout
-from typing import Dict, Any
+from PyQt5.QtWidgets import QGridLayout, QLabel, QWidget
+from PyQt5.QtCore import Qt
+from typing import Dict, Any, List, Optional
 
-from modules.styles.general_styles import (
-    apply_label_style, apply_text_style_light,
-    apply_text_style_primary, apply_font_weight, apply_text_color
+from modules.bids.tender_card_utils import (
+    CUSTOMER_NAME_LIMIT, format_balance_holder, build_link_label, plain_label, format_price_value,
+    format_date_value, prefixed_text
 )
-from modules.bids.tender_card_utils import format_balance_holder, build_link_label
 
 
-def create_header_layout(tender_data: Dict[str, Any], select_checkbox) -> QHBoxLayout:
+# Колонка 0 сетки карточки занята чекбоксом, содержимое строк начинается с колонки 1
+CONTENT_COLUMN = 1
+
+
+def create_card_grid(card: QWidget) -> QGridLayout:
+    """Создание единой сетки карточки вместо вложенных горизонтальных layout."""
+    grid = QGridLayout(card)
+    grid.setHorizontalSpacing(15)
+    grid.setVerticalSpacing(8)
+    grid.setContentsMargins(12, 12, 12, 12)
+    return grid
+
+
+def add_grid_row(grid: QGridLayout, widgets: List[QWidget]) -> None:
+    """Добавление строки виджетов в сетку (по одному в колонку, слева направо)."""
+    if not widgets:
+        return
+    row = grid.rowCount()
+    for column, widget in enumerate(widgets, CONTENT_COLUMN):
+        grid.addWidget(widget, row, column)
+
+
+def place_wide_widget(grid: QGridLayout, widget: QWidget, row: int, alignment=Qt.Alignment()) -> None:
+    """Размещение виджета в строке сетки на всю ширину содержимого."""
+    grid.addWidget(widget, row, CONTENT_COLUMN, 1, -1, alignment)
+
+
+def finish_card_grid(grid: QGridLayout) -> None:
+    """Свободное место отдается пустой последней колонке (вместо addStretch в строках)."""
+    grid.setColumnStretch(grid.columnCount(), 1)
+
+
+def add_header_row(grid: QGridLayout, tender_data: Dict[str, Any], select_checkbox) -> None:
     """Создание верхней строки с выбором и названием."""
-    header_layout = QHBoxLayout()
-    header_layout.setSpacing(10)
-    
-    header_layout.addWidget(select_checkbox)
+    grid.addWidget(select_checkbox, 0, 0, Qt.AlignTop)
     
     purchase_name = tender_data.get('auction_name', 'Без названия')
-    name_label = QLabel(purchase_name)
-    apply_label_style(name_label, 'h2')  # Используем стандартные стили (теперь увеличенные)
+    name_label = plain_label(purchase_name)
+    # Стиль h2 + font-weight задается общей таблицей стилей карточки
+    name_label.setProperty("role", "name")
     name_label.setWordWrap(True)
-    # Стиль h2 уже содержит color: text_dark, поэтому apply_text_color не нужен
-    apply_font_weight(name_label)
     name_label.setContentsMargins(0, 0, 0, 5)
-    header_layout.addWidget(name_label, 1)
-    
-    return header_layout
+    grid.addWidget(name_label, 0, CONTENT_COLUMN, 1, -1)
 
 
-def create_info_layout(tender_data: Dict[str, Any]) -> QHBoxLayout:
-    """Создание строки с основной информацией."""
-    info_layout = QHBoxLayout()
-    info_layout.setSpacing(15)
-    
-    contract_number = tender_data.get('contract_number', '')
-    if contract_number:
-        contract_label = QLabel(f"№ {contract_number}")
-        apply_label_style(contract_label, 'normal')  # Используем увеличенные стили для карточек
-        apply_text_style_light(contract_label)
-        info_layout.addWidget(contract_label)
-    
-    region_name = tender_data.get('region_name') or tender_data.get('delivery_region', '')
-    if region_name:
-        region_label = QLabel(f"📍 {region_name}")
-        apply_label_style(region_label, 'normal')  # Используем увеличенные стили для карточек
-        apply_text_style_light(region_label)
-        info_layout.addWidget(region_label)
-    
-    customer_name = (
-        tender_data.get('customer_short_name') or 
-        tender_data.get('customer_full_name', '')
-    )
-    if customer_name:
-        customer_label = QLabel(f"👤 {customer_name[:50]}")
-        apply_label_style(customer_label, 'normal')  # Используем увеличенные стили для карточек
-        apply_text_style_light(customer_label)
-        customer_label.setToolTip(customer_name)
-        info_layout.addWidget(customer_label)
-    
-    info_layout.addStretch()
-    return info_layout
+# Поля строк карточки: (ключи по приоритету, префикс, длина подписи, общая строка).
+# У полей с ограничением длины полное значение показывается в подсказке;
+# уникальные значения (номер контракта) не передаются в кэш подписей prefixed_text.
+_INFO_FIELDS = (
+    (('contract_number',), "№", None, False),
+    (('region_name', 'delivery_region'), "📍", None, True),
+    (('customer_short_name', 'customer_full_name'), "👤", CUSTOMER_NAME_LIMIT, True),
+)
+_PLATFORM_FIELD = (('platform_name',), "🏛", None, True)
+_CONTRACTOR_FIELD = (('contractor_short_name', 'contractor_full_name'), "🤝 Подрядчик:", 80, True)
+_OKPD_FIELD = (('okpd_sub_code', 'okpd_main_code'), "ОКПД:", None, True)
+
+
+def _field_label(get, keys, prefix: str, limit: Optional[int], shared: bool) -> Optional[QLabel]:
+    """Метка поля закупки (role="info"); None, если поле пустое - виджет не создается."""
+    value = None
+    for key in keys:
+        value = get(key)
+        if value:
+            break
+    if not value:
+        return None
+    shown = value[:limit] if limit and len(value) > limit else value
+    label = plain_label(prefixed_text(prefix, shown) if shared else f"{prefix} {shown}")
+    label.setProperty("role", "info")
+    if limit:
+        label.setToolTip(value)
+    return label
+
+
+def create_info_widgets(tender_data: Dict[str, Any]) -> List[QLabel]:
+    """
+    Создание строки с основной информацией.
 
+    Цвет и начертание меток задаются общей таблицей стилей карточки
+    по свойству role (TENDER_CARD_LABELS_STYLE), без setStyleSheet на каждую метку.
+    """
+    # Поля закупки читаются через один связанный метод
+    get = tender_data.get
+    labels = (_field_label(get, *field) for field in _INFO_FIELDS)
+    return [label for label in labels if label]
 
-def create_price_date_layout(tender_data: Dict[str, Any]) -> QHBoxLayout:
+
+def create_price_date_widgets(tender_data: Dict[str, Any]) -> List[QLabel]:
     """Создание строки с ценой и датой."""
-    from datetime import datetime
-    
-    price_date_layout = QHBoxLayout()
-    price_date_layout.setSpacing(15)
-    
-    initial_price = tender_data.get('initial_price')
+    get = tender_data.get
+    # Строки цены и даты готовим до создания виджетов (форматирование кэшируется)
+    price_str = None
+    initial_price = get('initial_price')
     if initial_price:
-        price_str = f"{float(initial_price):,.0f}".replace(',', ' ')
-        price_label = QLabel(f"💰 {price_str} ₽")
-        apply_label_style(price_label, 'large')  # Используем увеличенные стили для карточек
-        apply_text_style_primary(price_label)
-        apply_font_weight(price_label)
-        price_date_layout.addWidget(price_label)
+        price_str = format_price_value(initial_price)
     
-    end_date = tender_data.get('end_date')
+    date_str = None
+    end_date = get('end_date')
     if end_date:
-        if isinstance(end_date, str):
-            try:
-                end_date = datetime.strptime(end_date, '%Y-%m-%d').date()
-            except:
-                pass
-        if hasattr(end_date, 'strftime'):
-            date_str = end_date.strftime('%d.%m.%Y')
-            date_label = QLabel(f"📅 До {date_str}")
-            apply_label_style(date_label, 'normal')  # Используем увеличенные стили для карточек
-            apply_text_style_light(date_label)
-            price_date_layout.addWidget(date_label)
+        date_str = format_date_value(end_date)
+    
+    price_date_widgets = []
+    
+    if price_str:
+        price_label = plain_label(f"💰 {price_str} ₽")
+        price_label.setProperty("role", "price")
+        price_date_widgets.append(price_label)
+    
+    if date_str:
+        date_label = plain_label(prefixed_text("📅 До", date_str))
+        date_label.setProperty("role", "info")
+        price_date_widgets.append(date_label)
     
-    price_date_layout.addStretch()
-    return price_date_layout
+    return price_date_widgets
 
 
-def create_meta_layout(tender_data: Dict[str, Any]) -> QHBoxLayout:
+def create_meta_widgets(tender_data: Dict[str, Any]) -> List[QLabel]:
     """Создание строки с мета-информацией."""
-    meta_layout = QHBoxLayout()
-    meta_layout.setSpacing(15)
-    meta_items = 0
+    get = tender_data.get
+    meta_widgets = []
     
-    platform_name = tender_data.get('platform_name')
-    if platform_name:
-        platform_label = QLabel(f"🏛 {platform_name}")
-        apply_label_style(platform_label, 'normal')  # Используем увеличенные стили для карточек
-        apply_text_style_light(platform_label)
-        meta_layout.addWidget(platform_label)
-        meta_items += 1
+    platform_label = _field_label(get, *_PLATFORM_FIELD)
+    if platform_label:
+        meta_widgets.append(platform_label)
     
     balance_holder_text = format_balance_holder(tender_data)
     if balance_holder_text:
-        balance_label = QLabel(f"🏢 Балансодержатель: {balance_holder_text}")
-        apply_label_style(balance_label, 'normal')  # Используем увеличенные стили для карточек
-        apply_text_style_light(balance_label)
-        meta_layout.addWidget(balance_label)
-        meta_items += 1
+        balance_label = plain_label(prefixed_text("🏢 Балансодержатель:", balance_holder_text))
+        balance_label.setProperty("role", "info")
+        meta_widgets.append(balance_label)
     
-    contractor_name = (
-        tender_data.get("contractor_short_name")
-        or tender_data.get("contractor_full_name")
-    )
-    if contractor_name:
-        contractor_label = QLabel(f"🤝 Подрядчик: {contractor_name[:80]}")
-        apply_label_style(contractor_label, "normal")
-        apply_text_style_light(contractor_label)
-        contractor_label.setToolTip(contractor_name)
-        meta_layout.addWidget(contractor_label)
-        meta_items += 1
+    contractor_label = _field_label(get, *_CONTRACTOR_FIELD)
+    if contractor_label:
+        meta_widgets.append(contractor_label)
     
-    tender_link = tender_data.get('tender_link')
+    tender_link = get('tender_link')
     if tender_link:
         link_label = build_link_label("Ссылка на закупку", tender_link)
-        meta_layout.addWidget(link_label)
-        meta_items += 1
+        meta_widgets.append(link_label)
     
-    if meta_items:
-        meta_layout.addStretch()
-        return meta_layout
-    return None
+    return meta_widgets
 
 
-def create_okpd_label(tender_data: Dict[str, Any]) -> QLabel:
+def create_okpd_label(tender_data: Dict[str, Any]) -> Optional[QLabel]:
     """Создание метки с ОКПД кодом."""
-    okpd_code = (
-        tender_data.get('okpd_sub_code') or 
-        tender_data.get('okpd_main_code', '')
-    )
-    if okpd_code:
-        okpd_label = QLabel(f"ОКПД: {okpd_code}")
-        apply_label_style(okpd_label, 'normal')  # Используем увеличенные стили для карточек
-        apply_text_style_light(okpd_label)
-        return okpd_label
-    return None
+    return _field_label(tender_data.get, *_OKPD_FIELD)
 
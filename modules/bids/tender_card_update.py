@@ -2,26 +2,23 @@
 Модуль для обновления статуса карточки закупки.
 """
 
-from PyQt5.QtWidgets import QHBoxLayout
+from PyQt5.QtCore import Qt
+
+from modules.bids.tender_card_data_fetch import MISS
+from modules.bids.tender_card_ui import place_wide_widget
 
 
 def update_card_status(
     card,
     create_status_badges_func,
-    create_matches_preview_func
+    create_matches_preview_func,
+    match_summary=MISS
 ):
-    """Обновление статуса карточки без пересоздания."""
-    card._match_summary_cache = None
-    card._match_details_cache = None
+    """Обновление статуса карточки без пересоздания.
     
-    # Удаляем старый контейнер статуса
-    if hasattr(card, 'status_container') and card.status_container:
-        if card.status_container.parent():
-            parent_layout = card.status_container.parent().layout()
-            if parent_layout:
-                parent_layout.removeWidget(card.status_container)
-        card.status_container.deleteLater()
-        card.status_container = None
+    match_summary - заранее загруженная сводка (MISS - карточка запросит её сама).
+    """
+    card._match_summary_cache = match_summary
     
     # Удаляем старый превью совпадений
     if hasattr(card, 'matches_preview') and card.matches_preview:
@@ -31,22 +28,18 @@ def update_card_status(
         card.matches_preview.deleteLater()
         card.matches_preview = None
     
-    # Создаем новый контейнер статуса
-    card.status_container = create_status_badges_func()
-    if card.status_container:
-        main_layout = card.layout()
-        for i in range(main_layout.count()):
-            item = main_layout.itemAt(i)
-            if item and item.layout():
-                layout = item.layout()
-                if isinstance(layout, QHBoxLayout) and layout.count() > 0:
-                    last_item = layout.itemAt(layout.count() - 1)
-                    if last_item and last_item.spacerItem():
-                        layout.insertWidget(0, card.status_container)
-                        break
+    # Значки статуса постоянные - обновляем только текст и видимость
+    if card.status_container is not None:
+        card.status_container.refresh(card._fetch_match_summary())
+    else:
+        card.status_container = create_status_badges_func()
+        if card.status_container and card.layout():
+            place_wide_widget(card.layout(), card.status_container, card._status_row, Qt.AlignLeft)
     
-    # Создаем новый превью совпадений
-    card.matches_preview = create_matches_preview_func()
-    if card.matches_preview:
-        card.layout().addWidget(card.matches_preview)
+    # Превью пересоздаем, только если карточка уже отрисовывалась;
+    # иначе оно будет построено при первой отрисовке
+    if card._matches_built:
+        card.matches_preview = create_matches_preview_func()
+        if card.matches_preview:
+            place_wide_widget(card.layout(), card.matches_preview, card._preview_row)
 
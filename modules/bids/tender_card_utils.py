@@ -2,28 +2,122 @@
 Утилиты для работы с карточками закупок.
 """
 
-from typing import Any, Dict, Optional
-from PyQt5.QtWidgets import QLabel
+from datetime import date
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
+from PyQt5.QtWidgets import QFrame, QLabel, QVBoxLayout
 from PyQt5.QtCore import Qt
 
-from modules.styles.general_styles import apply_label_style
+
+def plain_label(text: str) -> QLabel:
+    """Создает метку с обычным текстом (без проверки на HTML при setText)."""
+    label = QLabel()
+    label.setTextFormat(Qt.PlainText)
+    label.setText(text)
+    return label
+
+
+def make_framed_vbox(spacing: int, **properties: str) -> Tuple[QFrame, QVBoxLayout]:
+    """
+    Создает рамку с вертикальной раскладкой для блоков диалога деталей.
+
+    Оформление задается общей таблицей стилей по динамическим свойствам
+    (например, detailRole="section"), поэтому setStyleSheet не нужен.
+    """
+    frame = QFrame()
+    for name, value in properties.items():
+        frame.setProperty(name, value)
+    layout = QVBoxLayout(frame)
+    layout.setSpacing(spacing)
+    return frame, layout
 
 
 def build_link_label(text: str, url: str) -> QLabel:
     """Создает кликабельную текстовую ссылку."""
     link_label = QLabel(f'<a href="{url}">{text}</a>')
-    apply_label_style(link_label, 'small')
+    # Стиль 'small' задается общей таблицей стилей карточки и диалога
+    link_label.setProperty("textStyle", "small")
     link_label.setTextFormat(Qt.RichText)
     link_label.setTextInteractionFlags(Qt.TextBrowserInteraction)
     link_label.setOpenExternalLinks(True)
     return link_label
 
 
-def format_balance_holder(data: Dict[str, Any]) -> Optional[str]:
-    """Форматирует подпись балансодержателя."""
-    name = data.get('balance_holder_name')
-    inn = data.get('balance_holder_inn')
+@lru_cache(maxsize=2048)
+def _format_balance_holder(name: Any, inn: Any) -> Optional[str]:
     if name and inn:
         return f"{name} (ИНН {inn})"
     return name or None
 
+
+def format_balance_holder(data: Dict[str, Any]) -> Optional[str]:
+    """Форматирует подпись балансодержателя (результат кэшируется по имени и ИНН)."""
+    return _format_balance_holder(
+        data.get('balance_holder_name'),
+        data.get('balance_holder_inn'),
+    )
+
+
+@lru_cache(maxsize=16384)
+def prefixed_text(prefix: str, value: Any) -> str:
+    """
+    Подпись вида «префикс значение» для повторяющихся полей закупок.
+
+    Регион, заказчик, площадка и ОКПД часто совпадают у многих закупок
+    списка: одна строка подписи создается на каждое значение, а не на каждую
+    карточку. Уникальные поля (номер контракта) через кэш не передаются.
+    """
+    return f"{prefix} {value}"
+
+
+# Длина имени заказчика в строке информации карточки (полное имя - в подсказке)
+CUSTOMER_NAME_LIMIT = 50
+
+
+def customer_display_name(data: Dict[str, Any]) -> Tuple[str, str]:
+    """Имя заказчика: (сокращенное для карточки, полное); пустые строки, если имени нет."""
+    full = data.get('customer_short_name') or data.get('customer_full_name') or ''
+    # Срез копирует строку, поэтому короткое имя используется как есть
+    return (full if len(full) <= CUSTOMER_NAME_LIMIT else full[:CUSTOMER_NAME_LIMIT]), full
+
+
+@lru_cache(maxsize=4096)
+def format_price_value(value: Any) -> Optional[str]:
+    """
+    Форматирует сумму с пробелами между разрядами; None, если значение не число.
+
+    Принимает число в исходном виде (Decimal из БД, int, float или строку):
+    приведение к float выполняется только при промахе кэша. Нечисловое
+    значение тоже кэшируется, поэтому исключение разбора возникает один раз.
+    Целые суммы форматируются без преобразования в float.
+    """
+    # type() вместо isinstance: bool не считается суммой
+    if type(value) is int:
+        return f"{value:_}".replace('_', ' ')
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return None
+    # Разделитель '_' не зависит от локали и заменяется одним проходом
+    # (str.translate для одного символа медленнее replace)
+    return f"{number:_.0f}".replace('_', ' ')
+
+
+@lru_cache(maxsize=1024)
+def _format_day(value: date) -> str:
+    """ДД.ММ.ГГГГ без strftime (у закупок списка даты часто совпадают)."""
+    return f"{value.day:02d}.{value.month:02d}.{value.year:04d}"
+
+
+def format_date_value(value: Any) -> Optional[str]:
+    """
+    Форматирует дату как ДД.ММ.ГГГГ; None, если значение не дата.
+
+    Строковые даты и datetime приводятся к datetime.date при загрузке закупок
+    (normalize_tender_row), поэтому здесь разбор строк не нужен.
+    """
+    if isinstance(value, date):
+        return _format_day(value)
+    if hasattr(value, 'strftime'):
+        return value.strftime('%d.%m.%Y')
+    return None
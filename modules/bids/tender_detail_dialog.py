@@ -3,7 +3,8 @@
 """
 
 from typing import Any, Dict, List, Optional, TYPE_CHECKING
-from PyQt5.QtWidgets import QDialog, QApplication, QMessageBox, QMainWindow
+from PyQt5.QtCore import QTimer
+from PyQt5.QtWidgets import QDialog, QApplication, QMessageBox, QMainWindow, QWidget
 from loguru import logger
 
 if TYPE_CHECKING:
@@ -25,7 +26,30 @@ class TenderDetailDialog(QDialog):
         parent=None,
     ):
         super().__init__(parent)
+        # Содержимое строится при первом показе (showEvent), а не в конструкторе
+        self._ui_built = False
+        self._set_data(
+            tender_data, document_search_service, tender_match_repository,
+            registry_type, initial_match_summary, initial_match_details,
+        )
         
+        try:
+            self.setWindowTitle("Подробная информация о закупке")
+            self._set_fullscreen_size()
+        except Exception as e:
+            from loguru import logger
+            logger.error(f"Ошибка при инициализации диалога деталей закупки: {e}", exc_info=True)
+            raise
+    
+    def _set_data(
+        self,
+        tender_data: Dict[str, Any],
+        document_search_service: Optional['DocumentSearchService'],
+        tender_match_repository: Optional['TenderMatchRepository'],
+        registry_type: Optional[str],
+        initial_match_summary: Optional[Dict[str, Any]],
+        initial_match_details: Optional[List[Dict[str, Any]]],
+    ) -> None:
         # Проверяем валидность данных перед инициализацией
         if not tender_data:
             raise ValueError("tender_data не может быть пустым")
@@ -37,22 +61,60 @@ class TenderDetailDialog(QDialog):
         try:
             self.registry_type = registry_type or self._determine_registry_type()
         except Exception as e:
-            from loguru import logger
             logger.warning(f"Ошибка при определении типа реестра: {e}, используем '44fz' по умолчанию")
             self.registry_type = '44fz'
         
         self.match_summary = initial_match_summary
         self.match_details = initial_match_details or []
+    
+    def set_tender_data(
+        self,
+        tender_data: Dict[str, Any],
+        document_search_service: Optional['DocumentSearchService'] = None,
+        tender_match_repository: Optional['TenderMatchRepository'] = None,
+        registry_type: Optional[str] = None,
+        initial_match_summary: Optional[Dict[str, Any]] = None,
+        initial_match_details: Optional[List[Dict[str, Any]]] = None,
+    ) -> None:
+        """
+        Повторное использование скрытого диалога для другой закупки.
         
+        Содержимое предыдущей закупки удаляется, новое строится при следующем
+        показе, как у только что созданного диалога.
+        """
+        self._set_data(
+            tender_data, document_search_service, tender_match_repository,
+            registry_type, initial_match_summary, initial_match_details,
+        )
+        if self._ui_built:
+            self._ui_built = False
+            self._clear_ui()
+        self._set_fullscreen_size()
+    
+    def _clear_ui(self) -> None:
+        layout = self.layout()
+        if layout is not None:
+            # Раскладка вместе с виджетами переходит к временному виджету
+            # и удаляется с ним; диалогу можно установить новую раскладку
+            QWidget().setLayout(layout)
+    
+    def showEvent(self, event):
+        if not self._ui_built:
+            self._ui_built = True
+            self._build_ui()
+        super().showEvent(event)
+    
+    def _build_ui(self):
+        """Загрузка совпадений и создание содержимого диалога (один раз)"""
         try:
-            self.setWindowTitle("Подробная информация о закупке")
-            self._set_fullscreen_size()
             self._load_match_data()
             self.init_ui()
         except Exception as e:
-            from loguru import logger
+            # Исключение из виртуального метода Qt завершило бы приложение,
+            # поэтому ошибка показывается здесь, а диалог закрывается
             logger.error(f"Ошибка при инициализации диалога деталей закупки: {e}", exc_info=True)
-            raise
+            QMessageBox.critical(self, "Ошибка", f"Не удалось открыть информацию о закупке:\n{e}")
+            QTimer.singleShot(0, self.reject)
     
     def _determine_registry_type(self) -> str:
         from modules.bids.tender_detail_dialog_helpers import determine_registry_type
@@ -76,16 +138,25 @@ class TenderDetailDialog(QDialog):
     def init_ui(self):
         """Инициализация интерфейса диалога"""
         from modules.bids.tender_detail_dialog_init import init_dialog_ui
+        # Одна перерисовка после сборки вместо перерисовки на каждый добавленный виджет
+        self.setUpdatesEnabled(False)
+        try:
+            init_dialog_ui(
+                self,
+                self.tender_data,
+                self.match_summary,
+                self.match_details,
+                self._download_all_documents,
+                self._handle_mark_uninteresting,
+                self._handle_move_to_funnel,
+            )
+        finally:
+            self.setUpdatesEnabled(True)
+    
+    def _download_all_documents(self, document_links):
+        """Скачивание всех документов закупки (кнопка секции документов)"""
         from modules.bids.tender_detail_dialog_download import handle_download_all_documents
-        init_dialog_ui(
-            self,
-            self.tender_data,
-            self.match_summary,
-            self.match_details,
-            lambda links: handle_download_all_documents(self, links, self.tender_data),
-            self._handle_mark_uninteresting,
-            self._handle_move_to_funnel,
-        )
+        handle_download_all_documents(self, document_links, self.tender_data)
     
     def _handle_mark_uninteresting(self):
         """Пометить тендер как неинтересный и закрыть диалог."""
@@ -266,7 +337,7 @@ class TenderDetailDialog(QDialog):
                 return
         except Exception as e:
             logger.error(f"Ошибка при открытии диалога выбора воронки: {e}", exc_info=True)
-            QMessageBox.critical(self, "Ошибка", f"Ошибка при открытии диалога: {str(e)}")
+            QMessageBox.critical(self, "Ошибка", f"Ошибка при открытии диалога: {e}")
             return
         
         # #region agent log
@@ -299,7 +370,7 @@ class TenderDetailDialog(QDialog):
             service = TenderToFunnelService(pipeline_repo, deal_repo)
         except Exception as e:
             logger.error(f"Ошибка при создании сервисов: {e}", exc_info=True)
-            QMessageBox.critical(self, "Ошибка", f"Ошибка при создании сервисов: {str(e)}")
+            QMessageBox.critical(self, "Ошибка", f"Ошибка при создании сервисов: {e}")
             return
         
         # Получаем user_id (по умолчанию 1)
@@ -350,7 +421,7 @@ class TenderDetailDialog(QDialog):
             
         except Exception as e:
             logger.error(f"Ошибка при перемещении закупки в воронку: {e}", exc_info=True)
-            QMessageBox.critical(self, "Ошибка", f"Ошибка при перемещении закупки: {str(e)}")
+            QMessageBox.critical(self, "Ошибка", f"Ошибка при перемещении закупки: {e}")
             return
         
         if deal_id:
@@ -429,3 +500,50 @@ class TenderDetailDialog(QDialog):
         except Exception as e:
             logger.error(f"Ошибка при обновлении виджета воронки: {e}", exc_info=True)
 
+
+# Последний созданный диалог: повторно используется следующей закупкой
+_reusable_dialog: Optional[TenderDetailDialog] = None
+
+
+def get_tender_detail_dialog(
+    tender_data: Dict[str, Any],
+    document_search_service: Optional['DocumentSearchService'] = None,
+    tender_match_repository: Optional['TenderMatchRepository'] = None,
+    registry_type: Optional[str] = None,
+    initial_match_summary: Optional[Dict[str, Any]] = None,
+    initial_match_details: Optional[List[Dict[str, Any]]] = None,
+    parent=None,
+) -> TenderDetailDialog:
+    """
+    Диалог деталей закупки: скрытый диалог того же окна переиспользуется.
+    
+    Хранится один диалог; диалог другого окна заменяет его в кэше.
+    """
+    global _reusable_dialog
+    dialog = _reusable_dialog
+    if dialog is not None:
+        try:
+            reusable = dialog.parent() is parent and not dialog.isVisible()
+        except RuntimeError:
+            # Диалог удален вместе с родительским окном
+            dialog = _reusable_dialog = None
+            reusable = False
+        if reusable:
+            dialog.set_tender_data(
+                tender_data, document_search_service, tender_match_repository,
+                registry_type, initial_match_summary, initial_match_details,
+            )
+            return dialog
+        if dialog is not None and not dialog.isVisible():
+            dialog.deleteLater()
+    
+    _reusable_dialog = TenderDetailDialog(
+        tender_data,
+        document_search_service=document_search_service,
+        tender_match_repository=tender_match_repository,
+        registry_type=registry_type,
+        initial_match_summary=initial_match_summary,
+        initial_match_details=initial_match_details,
+        parent=parent,
+    )
+    return _reusable_dialog
@@ -2,11 +2,22 @@
 
 from pathlib import Path
 from PyQt5.QtWidgets import QMessageBox
-from loguru import logger
 from modules.bids.document_download_thread import DocumentDownloadThread
+from modules.bids.tender_registry_type import determine_registry_type
 from config.settings import config
 
 
+# Запущенные потоки скачивания: сильные ссылки не дают сборщику мусора удалить
+# QThread до завершения, после завершения поток удаляется через deleteLater
+_active_download_threads = set()
+
+
+def _release_download_thread(download_thread: DocumentDownloadThread) -> None:
+    """Освобождение завершившегося потока скачивания"""
+    _active_download_threads.discard(download_thread)
+    download_thread.deleteLater()
+
+
 def handle_download_all_documents(dialog, document_links: list, tender_data: dict):
     """Обработчик скачивания всех документов"""
     if not document_links:
@@ -23,11 +34,14 @@ def handle_download_all_documents(dialog, document_links: list, tender_data: dic
         )
         return
     
-    download_thread = DocumentDownloadThread(document_links, download_dir, tender_data)
-    download_thread.progress_updated.connect(
-        lambda current, total, file_name: logger.info(f"Скачивание: {current}/{total} - {file_name}")
+    download_thread = DocumentDownloadThread(
+        document_links, download_dir,
+        tender_data.get('id'), determine_registry_type(tender_data),
+        max_workers=config.document_download_workers,
     )
-    download_thread.finished.connect(
+    # Прогресс пишется в лог самим потоком: progress_updated не подключается,
+    # чтобы каждый документ не ставил событие в очередь GUI-потока
+    download_thread.download_finished.connect(
         lambda downloaded_count, total_count, download_dir: QMessageBox.information(
             dialog,
             "Скачивание завершено",
@@ -38,6 +52,9 @@ def handle_download_all_documents(dialog, document_links: list, tender_data: dic
     download_thread.error_occurred.connect(
         lambda error_message: QMessageBox.critical(dialog, "Ошибка", error_message)
     )
+    # QThread.finished испускается и после ошибки, и после успешного скачивания
+    download_thread.finished.connect(lambda: _release_download_thread(download_thread))
+    _active_download_threads.add(download_thread)
     download_thread.start()
     
     QMessageBox.information(
@@ -1,29 +1,31 @@
 """Модуль для форматирования данных в диалоге деталей закупки."""
 
-from datetime import datetime
+from decimal import Decimal
+from functools import lru_cache
 from typing import Any, Optional
 
+from modules.bids.tender_card_utils import format_price_value, format_date_value
+
+# Типы цены, которые передаются в кэшируемый форматтер (остальные выводятся как есть)
+_PRICE_TYPES = (int, float, Decimal, str)
+
+
+@lru_cache(maxsize=4096)
+def _price_text(price: Any) -> str:
+    # Готовая строка поля диалога: у закупок часто совпадают суммы обеспечения и цены
+    price_str = format_price_value(price)
+    return f"{price_str} ₽" if price_str else f"{price}"
+
 
 def format_price(price: Optional[Any]) -> str:
-    """Форматирование цены"""
-    if not price:
+    """Форматирование цены (0 - допустимая цена, а не отсутствие значения)"""
+    if price in (None, "", "—"):
         return "—"
-    try:
-        return f"{float(price):,.0f} ₽".replace(',', ' ')
-    except:
-        return str(price)
+    return _price_text(price) if isinstance(price, _PRICE_TYPES) else f"{price}"
 
 
 def format_date(date_value: Optional[Any]) -> str:
     """Форматирование даты"""
     if not date_value:
         return "—"
-    try:
-        if isinstance(date_value, str):
-            date_value = datetime.strptime(date_value, '%Y-%m-%d').date()
-        if hasattr(date_value, 'strftime'):
-            return date_value.strftime('%d.%m.%Y')
-        return str(date_value)
-    except:
-        return str(date_value) if date_value else "—"
-
+    return format_date_value(date_value) or f"{date_value}"
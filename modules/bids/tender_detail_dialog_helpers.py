@@ -1,33 +1,53 @@
 """Модуль с вспомогательными функциями для диалога деталей закупки."""
 
-from typing import Any, Dict, List, Optional, TYPE_CHECKING
+from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
 from PyQt5.QtWidgets import QApplication
 
+from modules.bids.tender_registry_type import determine_registry_type  # noqa: F401 (реэкспорт)
+
 if TYPE_CHECKING:
     from services.tender_match_repository import TenderMatchRepository
 
 
-def determine_registry_type(tender_data: Dict[str, Any]) -> str:
-    """Определяет тип реестра (44ФЗ/223ФЗ)"""
-    raw_value = (
-        tender_data.get('registry_type')
-        or tender_data.get('law')
-        or ''
-    )
-    value = str(raw_value).lower()
-    return '223fz' if '223' in value else '44fz'
+# Геометрия диалога (x, y, ширина, высота), вычисляется один раз на процесс
+_dialog_geometry_cache: Optional[Tuple[int, int, int, int]] = None
+# Экраны, на сигналы которых уже подписан сброс кэша
+_watched_screens: set = set()
 
 
-def set_fullscreen_size(dialog):
-    """Установка размера диалога в полный размер экрана"""
-    screen = QApplication.primaryScreen()
-    if screen:
+def _reset_dialog_geometry(*_args) -> None:
+    global _dialog_geometry_cache
+    _dialog_geometry_cache = None
+
+
+def _dialog_geometry() -> Optional[Tuple[int, int, int, int]]:
+    """95% доступной области основного экрана, по центру (кэшируется)"""
+    global _dialog_geometry_cache
+    if _dialog_geometry_cache is None:
+        screen = QApplication.primaryScreen()
+        if not screen:
+            return None
         available_geometry = screen.availableGeometry()
         width = int(available_geometry.width() * 0.95)
         height = int(available_geometry.height() * 0.95)
-        dialog.resize(width, height)
         x = available_geometry.x() + (available_geometry.width() - width) // 2
         y = available_geometry.y() + (available_geometry.height() - height) // 2
+        _dialog_geometry_cache = (x, y, width, height)
+        # Смена основного экрана или его области сбрасывает кэш
+        if not _watched_screens:
+            QApplication.instance().primaryScreenChanged.connect(_reset_dialog_geometry)
+        if id(screen) not in _watched_screens:
+            _watched_screens.add(id(screen))
+            screen.availableGeometryChanged.connect(_reset_dialog_geometry)
+    return _dialog_geometry_cache
+
+
+def set_fullscreen_size(dialog):
+    """Установка размера диалога в полный размер экрана"""
+    geometry = _dialog_geometry()
+    if geometry:
+        x, y, width, height = geometry
+        dialog.resize(width, height)
         dialog.move(x, y)
     else:
         from modules.styles.ui_config import configure_dialog
@@ -1,10 +1,10 @@
 """Модуль для инициализации UI диалога деталей закупки."""
 
-from typing import Any, Dict, Optional, Callable
+from collections import deque
+from functools import partial
+from typing import Any, Dict, List, Optional, Callable
+from PyQt5.QtCore import QTimer
 from PyQt5.QtWidgets import QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QScrollArea, QWidget
-from modules.styles.general_styles import (
-    apply_label_style, apply_button_style, apply_scroll_area_style
-)
 from modules.bids.tender_detail_dialog_ui import (
     create_separator, create_info_section, create_documents_section, create_match_column
 )
@@ -12,6 +12,48 @@ from modules.bids.tender_detail_dialog_format import format_price, format_date
 from modules.bids.tender_card_utils import format_balance_holder, build_link_label
 
 
+def build_sections_staged(
+    parent: QWidget,
+    layout: QVBoxLayout,
+    factories: List[Callable[[], Optional[QWidget]]],
+) -> None:
+    """
+    Поэтапное создание секций: по одной за итерацию цикла событий.
+    
+    Секции создаются без родителя и вставляются перед завершающим растяжением
+    раскладки все сразу после создания последней: раскладка пересчитывается
+    один раз, а не после каждой секции. Таймер принадлежит parent, поэтому
+    при закрытии диалога сборка прекращается.
+    """
+    pending = deque(factories)
+    built: List[QWidget] = []
+    timer = QTimer(parent)
+    timer.setInterval(0)
+    
+    def build_next():
+        if pending:
+            section = pending.popleft()()
+            if section is not None:
+                built.append(section)
+            if pending:
+                return
+        timer.stop()
+        timer.deleteLater()
+        if not built:
+            return
+        parent.setUpdatesEnabled(False)
+        try:
+            position = layout.count() - 1
+            for section in built:
+                layout.insertWidget(position, section)
+                position += 1
+        finally:
+            parent.setUpdatesEnabled(True)
+    
+    timer.timeout.connect(build_next)
+    timer.start()
+
+
 def init_dialog_ui(
     dialog,
     tender_data: Dict[str, Any],
@@ -22,22 +64,25 @@ def init_dialog_ui(
     move_to_funnel_handler: Optional[Callable[[], None]] = None,
 ) -> None:
     """Инициализация интерфейса диалога"""
+    # Поля закупки читаются через один связанный метод
+    get = tender_data.get
     layout = QVBoxLayout(dialog)
     layout.setSpacing(15)
     layout.setContentsMargins(20, 20, 20, 20)
     
     scroll = QScrollArea()
     scroll.setWidgetResizable(True)
-    apply_scroll_area_style(scroll, 'card')
+    scroll.setProperty("detailRole", "content")
     
     content_widget = QWidget()
+    content_widget.setUpdatesEnabled(False)
     content_layout = QVBoxLayout(content_widget)
     content_layout.setSpacing(12)
     content_layout.setContentsMargins(15, 15, 15, 15)
     
-    purchase_name = tender_data.get('auction_name', 'Без названия')
+    purchase_name = get('auction_name', 'Без названия')
     name_label = QLabel(purchase_name)
-    apply_label_style(name_label, 'h1')
+    name_label.setProperty("textStyle", "h1")
     name_label.setWordWrap(True)
     content_layout.addWidget(name_label)
     content_layout.addWidget(create_separator())
@@ -49,56 +94,61 @@ def init_dialog_ui(
     left_layout = QVBoxLayout(left_widget)
     left_layout.setSpacing(12)
     
+    # Сразу создается только первая секция, остальные - после возврата в цикл
+    # событий (build_sections_staged), чтобы диалог появлялся без задержки
     left_layout.addWidget(create_info_section("Основная информация", [
-        ("Номер контракта", tender_data.get('contract_number')),
-        ("Площадка", tender_data.get('platform_name')),
+        ("Номер контракта", get('contract_number')),
+        ("Площадка", get('platform_name')),
         ("Балансодержатель", format_balance_holder(tender_data)),
-        ("Регион", tender_data.get('region_name') or tender_data.get('delivery_region')),
+        ("Регион", get('region_name') or get('delivery_region')),
     ]))
+    left_layout.addStretch()
     
-    left_layout.addWidget(create_info_section("Участники", [
-        ("Заказчик", tender_data.get('customer_full_name') or tender_data.get('customer_short_name')),
-        ("Подрядчик", tender_data.get('contractor_full_name') or tender_data.get('contractor_short_name')),
-    ]))
+    pending_sections = [
+        partial(create_info_section, "Участники", [
+            ("Заказчик", get('customer_full_name') or get('customer_short_name')),
+            ("Подрядчик", get('contractor_full_name') or get('contractor_short_name')),
+        ]),
+    ]
     
-    okpd_code = tender_data.get('okpd_sub_code') or tender_data.get('okpd_main_code', '')
-    okpd_name = tender_data.get('okpd_name', '')
+    okpd_code = get('okpd_sub_code') or get('okpd_main_code', '')
+    okpd_name = get('okpd_name', '')
     if okpd_code:
-        left_layout.addWidget(create_info_section("ОКПД", [
+        pending_sections.append(partial(create_info_section, "ОКПД", [
             ("Код", okpd_code),
             ("Название", okpd_name),
         ]))
     
-    left_layout.addWidget(create_info_section("Финансы", [
-        ("Начальная цена", format_price(tender_data.get('initial_price'))),
-        ("Финальная цена", format_price(tender_data.get('final_price'))),
-        ("Сумма обеспечения", format_price(tender_data.get('guarantee_amount'))),
+    pending_sections.append(partial(create_info_section, "Финансы", [
+        ("Начальная цена", format_price(get('initial_price'))),
+        ("Финальная цена", format_price(get('final_price'))),
+        ("Сумма обеспечения", format_price(get('guarantee_amount'))),
     ]))
     
-    left_layout.addWidget(create_info_section("Даты", [
-        ("Дата начала", format_date(tender_data.get('start_date'))),
-        ("Дата окончания", format_date(tender_data.get('end_date'))),
-        ("Начало поставки", format_date(tender_data.get('delivery_start_date'))),
-        ("Конец поставки", format_date(tender_data.get('delivery_end_date'))),
+    pending_sections.append(partial(create_info_section, "Даты", [
+        ("Дата начала", format_date(get('start_date'))),
+        ("Дата окончания", format_date(get('end_date'))),
+        ("Начало поставки", format_date(get('delivery_start_date'))),
+        ("Конец поставки", format_date(get('delivery_end_date'))),
     ]))
     
-    delivery_region = tender_data.get('delivery_region')
-    delivery_address = tender_data.get('delivery_address')
+    delivery_region = get('delivery_region')
+    delivery_address = get('delivery_address')
     if delivery_region or delivery_address:
-        left_layout.addWidget(create_info_section("Доставка", [
+        pending_sections.append(partial(create_info_section, "Доставка", [
             ("Регион доставки", delivery_region),
             ("Адрес доставки", delivery_address),
         ]))
     
-    document_links = tender_data.get('document_links', [])
+    document_links = get('document_links', [])
     if document_links:
-        left_layout.addWidget(create_documents_section(document_links, download_handler))
+        pending_sections.append(partial(create_documents_section, document_links, download_handler))
     
-    tender_link = tender_data.get('tender_link')
+    tender_link = get('tender_link')
     if tender_link:
-        left_layout.addWidget(build_link_label("Ссылка на закупку", tender_link))
+        pending_sections.append(partial(build_link_label, "Ссылка на закупку", tender_link))
     
-    left_layout.addStretch()
+    build_sections_staged(left_widget, left_layout, pending_sections)
     columns_layout.addWidget(left_widget, 2)
     
     match_column = create_match_column(match_summary, match_details)
@@ -106,6 +156,7 @@ def init_dialog_ui(
         columns_layout.addWidget(match_column, 1)
     
     content_layout.addLayout(columns_layout)
+    content_widget.setUpdatesEnabled(True)
     scroll.setWidget(content_widget)
     layout.addWidget(scroll)
     
@@ -114,18 +165,18 @@ def init_dialog_ui(
     
     if move_to_funnel_handler is not None:
         btn_move_to_funnel = QPushButton("📊 Переместить в воронку продаж")
-        apply_button_style(btn_move_to_funnel, "primary")
+        btn_move_to_funnel.setProperty("buttonStyle", "primary")
         btn_move_to_funnel.clicked.connect(move_to_funnel_handler)
         buttons_layout.addWidget(btn_move_to_funnel)
     
     if mark_uninteresting_handler is not None:
         btn_uninteresting = QPushButton("Пометить как неинтересную")
-        apply_button_style(btn_uninteresting, "secondary")
+        btn_uninteresting.setProperty("buttonStyle", "secondary")
         btn_uninteresting.clicked.connect(mark_uninteresting_handler)
         buttons_layout.addWidget(btn_uninteresting)
     
     btn_close = QPushButton("Закрыть")
-    apply_button_style(btn_close, "secondary")
+    btn_close.setProperty("buttonStyle", "secondary")
     btn_close.clicked.connect(dialog.accept)
     buttons_layout.addWidget(btn_close)
     
@@ -0,0 +1,93 @@
+"""
+Список ссылок на документы закупки в диалоге деталей.
+
+Вместо отдельной QPushButton на каждый документ используется одна
+QListView с моделью: строка списка - это запись модели, а не виджет.
+Оформление строк задается общей таблицей стилей (TENDER_DETAIL_STYLE).
+"""
+
+from typing import Any, Dict, List, Optional
+
+from PyQt5.QtCore import QAbstractListModel, QModelIndex, QUrl, Qt
+from PyQt5.QtGui import QDesktopServices
+from PyQt5.QtWidgets import QAbstractItemView, QListView, QSizePolicy
+
+
+class DocLinksModel(QAbstractListModel):
+    """Модель документов со ссылками: текст строки и QUrl ссылки (Qt.UserRole)"""
+
+    def __init__(self, documents: List[Dict[str, Any]], parent=None):
+        super().__init__(parent)
+        # Документы без ссылки в список не попадают
+        self._rows = [
+            (doc.get('file_name', 'Документ'), doc['document_links'])
+            for doc in documents
+            if doc.get('document_links')
+        ]
+        # Текст строки собирается при первой отрисовке строки, QUrl - при
+        # первом открытии документа: невидимые строки не стоят ничего
+        self._texts: Dict[int, str] = {}
+        self._urls: Dict[int, QUrl] = {}
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+        row = index.row()
+        file_name, link = self._rows[row]
+        if role == Qt.DisplayRole:
+            text = self._texts.get(row)
+            if text is None:
+                text = self._texts[row] = f"📄 {file_name}"
+            return text
+        if role == Qt.ToolTipRole:
+            return link
+        if role == Qt.UserRole:
+            url = self._urls.get(row)
+            if url is None:
+                url = self._urls[row] = QUrl(link)
+            return url
+        return None
+
+
+def _open_doc_link(index: QModelIndex) -> None:
+    QDesktopServices.openUrl(index.data(Qt.UserRole))
+
+
+class DocLinksView(QListView):
+    """Список документов без собственной прокрутки: высота по содержимому"""
+
+    def __init__(self, model: DocLinksModel, parent=None):
+        super().__init__(parent)
+        self.setProperty("detailRole", "docs")
+        model.setParent(self)
+        self.setModel(model)
+        self.setUniformItemSizes(True)
+        self.setSpacing(2)
+        self.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.setSelectionMode(QAbstractItemView.NoSelection)
+        self.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
+        self.setMouseTracking(True)
+        self.setCursor(Qt.PointingHandCursor)
+        self.clicked.connect(_open_doc_link)
+
+    def sizeHint(self):
+        hint = super().sizeHint()
+        rows = self.model().rowCount()
+        row_height = self.sizeHintForRow(0) if rows else 0
+        # Строки и отступы между ними (spacing с двух сторон каждой строки)
+        height = rows * (row_height + 2 * self.spacing()) + 2 * self.frameWidth()
+        hint.setHeight(height)
+        return hint
+
+
+def create_doc_links_view(documents: List[Dict[str, Any]]) -> Optional[DocLinksView]:
+    """Создает список документов (None, если ссылок нет: виджет не создается)"""
+    model = DocLinksModel(documents)
+    if not model.rowCount():
+        return None
+    return DocLinksView(model)
@@ -0,0 +1,103 @@
+"""
+Подготовка списка закупок вне GUI-потока.
+
+Батч-загрузка сводок совпадений и сортировка выполняются в QThreadPool,
+а создание и обновление карточек - в GUI-потоке по сигналу finished.
+"""
+
+from typing import Any, Callable, Dict, List, Optional, TYPE_CHECKING
+
+from PyQt5.QtCore import QObject, QRunnable, pyqtSignal
+from loguru import logger
+
+from modules.bids.tender_card_utils import (
+    format_balance_holder, format_date_value, format_price_value
+)
+from modules.bids.tender_registry_type import determine_registry_type
+
+if TYPE_CHECKING:
+    from services.tender_match_repository import TenderMatchRepository
+
+
+def prefetch_match_details(
+    repository: Optional['TenderMatchRepository'],
+    sorted_tenders: List[Dict[str, Any]],
+    summaries: Dict[tuple, Dict[str, Any]],
+    count: int,
+    limit: int,
+) -> int:
+    """
+    Предзагрузка деталей совпадений для первых (видимых) карточек.
+    
+    Детали попадают в общий LRU-кэш репозитория, поэтому превью,
+    строящееся при первой отрисовке карточки, не обращается к БД
+    в GUI-потоке. Загрузка - один запрос на тип реестра.
+    
+    Returns:
+        Количество закупок, для которых загружены детали
+    """
+    if not repository or count <= 0:
+        return 0
+    ids_by_registry: Dict[str, List[int]] = {}
+    prefetched = 0
+    for tender in sorted_tenders:
+        if prefetched >= count:
+            break
+        tender_id = tender.get('id')
+        registry_type = determine_registry_type(tender)
+        if not tender_id or not summaries.get((tender_id, registry_type)):
+            continue
+        ids_by_registry.setdefault(registry_type, []).append(tender_id)
+        prefetched += 1
+    for registry_type, tender_ids in ids_by_registry.items():
+        repository.get_match_details_batch(tender_ids, registry_type, limit=limit)
+    return prefetched
+
+
+def prewarm_card_formatting(tenders: List[Dict[str, Any]]) -> None:
+    """
+    Заполнение кэшей форматирования цены, даты и балансодержателя.
+
+    Даты приходят уже разобранными (normalize_tender_row), а строки цены и
+    даты форматируются кэшируемыми функциями: после прогрева в пуле потоков
+    карточки в GUI-потоке получают готовые строки из кэша.
+    """
+    for tender in tenders:
+        get = tender.get
+        initial_price = get('initial_price')
+        if initial_price:
+            format_price_value(initial_price)
+        end_date = get('end_date')
+        if end_date:
+            format_date_value(end_date)
+        format_balance_holder(tender)
+
+
+class TenderPrepareSignals(QObject):
+    """Сигналы задачи подготовки (QRunnable не является QObject)"""
+    # (номер поколения, подготовленные данные или None при ошибке)
+    finished = pyqtSignal(int, object)
+
+
+class TenderPrepareTask(QRunnable):
+    """Задача пула потоков: подготовка данных для карточек без работы с виджетами"""
+
+    def __init__(
+        self,
+        generation: int,
+        tenders: List[Dict[str, Any]],
+        prepare_func: Callable[[List[Dict[str, Any]]], Dict[str, Any]],
+    ):
+        super().__init__()
+        self.generation = generation
+        self.tenders = tenders
+        self.prepare_func = prepare_func
+        self.signals = TenderPrepareSignals()
+
+    def run(self):
+        try:
+            prepared = self.prepare_func(self.tenders)
+        except Exception as e:
+            logger.error(f"Ошибка при подготовке списка закупок: {e}")
+            prepared = None
+        self.signals.finished.emit(self.generation, prepared)
@@ -0,0 +1,112 @@
+"""
+Список закупок на QListView с отрисовкой карточек делегатом.
+
+Используется TenderListWidget для длинных списков: вместо дерева виджетов
+TenderCard на каждую закупку создаются только модель и делегат, а рисуются
+лишь видимые строки. Двойной клик открывает тот же TenderDetailDialog.
+"""
+
+from typing import Any, Dict, List, Optional, TYPE_CHECKING
+
+from PyQt5.QtCore import QModelIndex, Qt, pyqtSignal
+from PyQt5.QtWidgets import QAbstractItemView, QFrame, QListView, QMessageBox
+from loguru import logger
+
+from modules.bids.tender_card import TenderCard
+from modules.bids.tender_card_data_fetch import fetch_match_details_with_cache, naive_copy
+from modules.bids.tender_card_delegate import (
+    SUMMARY_ROLE, TENDER_ROLE, TenderCardDelegate, TenderListModel
+)
+from modules.bids.tender_detail_dialog import get_tender_detail_dialog
+from modules.bids.tender_registry_type import determine_registry_type
+
+if TYPE_CHECKING:
+    from services.document_search_service import DocumentSearchService
+    from services.tender_match_repository import TenderMatchRepository
+
+
+class TenderListView(QListView):
+    """Список карточек закупок: одна модель и один делегат на весь список"""
+
+    selection_changed = pyqtSignal(bool)
+
+    def __init__(
+        self,
+        document_search_service: Optional['DocumentSearchService'] = None,
+        tender_match_repository: Optional['TenderMatchRepository'] = None,
+        parent=None,
+    ):
+        super().__init__(parent)
+        self.document_search_service = document_search_service
+        self.tender_match_repository = tender_match_repository
+        self._model = TenderListModel(self)
+        self._delegate = TenderCardDelegate(self)
+        self.setModel(self._model)
+        self.setItemDelegate(self._delegate)
+        self.setFrameShape(QFrame.NoFrame)
+        self.setSelectionMode(QAbstractItemView.NoSelection)
+        self.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.setResizeMode(QListView.Adjust)
+        # Те же поля, что у контейнера карточек в TenderListWidget
+        self.setViewportMargins(15, 15, 15, 0)
+        # Подсветка рамки при наведении (State_MouseOver в делегате)
+        self.setMouseTracking(True)
+        self._model.dataChanged.connect(self._on_data_changed)
+        self.doubleClicked.connect(self._open_details)
+        self._layout_width = 0
+
+    def set_tenders(
+        self,
+        tenders: List[Dict[str, Any]],
+        summaries: Optional[Dict[tuple, Dict[str, Any]]] = None,
+    ) -> None:
+        """Замена списка закупок (сводки - {(tender_id, registry_type): summary})"""
+        self._delegate.clear_size_cache()
+        self._model.set_tenders(tenders, summaries)
+
+    def selected_tenders(self) -> List[Dict[str, Any]]:
+        """Закупки, отмеченные флажком"""
+        return self._model.selected_tenders()
+
+    def resizeEvent(self, event) -> None:
+        super().resizeEvent(event)
+        # Высота карточки зависит от переноса названия: при смене ширины
+        # размеры пересчитываются делегатом по новой ширине области просмотра
+        width = self.viewport().width()
+        if width != self._layout_width:
+            self._layout_width = width
+            self._delegate.clear_size_cache()
+            self.scheduleDelayedItemsLayout()
+
+    def _on_data_changed(self, top_left: QModelIndex, _bottom_right: QModelIndex, roles=()) -> None:
+        if Qt.CheckStateRole in roles:
+            self.selection_changed.emit(top_left.data(Qt.CheckStateRole) == Qt.Checked)
+
+    def _open_details(self, index: QModelIndex) -> None:
+        """Открытие полной информации о закупке (как двойной клик по TenderCard)"""
+        tender = index.data(TENDER_ROLE) or {}
+        tender_id = tender.get('id')
+        if not tender_id:
+            return
+        try:
+            registry_type = determine_registry_type(tender)
+            match_summary = index.data(SUMMARY_ROLE)
+            match_details = fetch_match_details_with_cache(
+                self.tender_match_repository, tender_id, registry_type,
+                None, TenderCard.MATCH_DETAILS_CACHE_LIMIT
+            ) if match_summary else None
+            dialog = get_tender_detail_dialog(
+                naive_copy(tender),
+                document_search_service=self.document_search_service,
+                tender_match_repository=self.tender_match_repository,
+                registry_type=registry_type,
+                initial_match_summary=naive_copy(match_summary) if match_summary else None,
+                initial_match_details=naive_copy(match_details) if match_details else None,
+                parent=self.window(),
+            )
+            dialog.exec_()
+        except Exception as e:
+            logger.error(f"Ошибка при открытии диалога деталей закупки ID {tender_id}: {e}", exc_info=True)
+            QMessageBox.critical(self, "Ошибка", f"Не удалось открыть информацию о закупке:\n{e}")
@@ -5,11 +5,17 @@
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QScrollArea, QFrame, QLabel
 )
-from PyQt5.QtCore import Qt, QThread, pyqtSignal
+from PyQt5.QtCore import Qt, QThread, QThreadPool, pyqtSignal
 from typing import List, Dict, Any, Callable, Optional
 from loguru import logger
 
 from modules.bids.tender_card import TenderCard
+from modules.bids.tender_list_view import TenderListView
+from modules.bids.tender_registry_type import determine_registry_type
+from modules.bids.tender_card_data_fetch import MISS
+from modules.bids.tender_list_prepare import (
+    TenderPrepareTask, prefetch_match_details, prewarm_card_formatting
+)
 from modules.styles.general_styles import (
     apply_label_style, apply_frame_style, apply_scroll_area_style,
     apply_text_color
@@ -33,6 +39,13 @@ class TenderListWidget(QWidget):
     """
     Виджет списка карточек закупок с прокруткой и индикатором загрузки
     """
+    # Сколько первых карточек получают детали совпадений заранее (в пуле потоков)
+    PREFETCH_DETAILS_COUNT = 10
+    # Начиная с этого числа закупок список рисуется делегатом (TenderListView)
+    # вместо отдельного виджета TenderCard на каждую закупку
+    LIST_VIEW_THRESHOLD = 200
+    # Сколько убранных из списка карточек хранится для повторного использования
+    CARD_POOL_LIMIT = 50
     
     def __init__(
         self,
@@ -42,9 +55,17 @@ class TenderListWidget(QWidget):
     ):
         super().__init__(parent)
         self.tender_cards: List[TenderCard] = []
+        # Скрытые карточки для повторного использования (TenderCard.rebind)
+        self._card_pool: List[TenderCard] = []
         self.document_search_service = document_search_service
         self.tender_match_repository = tender_match_repository
         self._loaded = False  # Флаг, что данные были загружены после "Показать тендеры"
+        # Номер последнего запроса set_tenders (подготовка идет в пуле потоков)
+        self._prepare_generation = 0
+        self._pending_total_count: Optional[int] = None
+        self._pending_start_time = 0.0
+        # Список показан через TenderListView (а не карточками TenderCard)
+        self._list_view_active = False
         self.init_ui()
     
     def init_ui(self):
@@ -73,6 +94,15 @@ class TenderListWidget(QWidget):
         self.scroll_area.setWidget(self.cards_container)
         layout.addWidget(self.scroll_area)
         
+        # Список на модели и делегате для длинных списков (скрыт по умолчанию)
+        self.list_view = TenderListView(
+            document_search_service=self.document_search_service,
+            tender_match_repository=self.tender_match_repository,
+        )
+        self.list_view.selection_changed.connect(self._on_card_selection_changed)
+        self.list_view.hide()
+        layout.addWidget(self.list_view)
+        
         # Индикатор загрузки (скрыт по умолчанию)
         self.loading_indicator = self._create_loading_indicator()
         self.cards_layout.addWidget(self.loading_indicator)
@@ -97,6 +127,7 @@ class TenderListWidget(QWidget):
     
     def show_loading(self):
         """Показать индикатор загрузки"""
+        self._use_list_view(False)
         self.clear_cards()
         self.loading_indicator.show()
         self.cards_layout.addWidget(self.loading_indicator)
@@ -109,34 +140,55 @@ class TenderListWidget(QWidget):
     def clear_cards(self):
         """Очистить все карточки"""
         for card in self.tender_cards:
-            self.cards_layout.removeWidget(card)
-            card.deleteLater()
+            self._release_card(card)
         self.tender_cards.clear()
     
-    def add_tender_card(self, tender_data: Dict[str, Any]):
-        """Добавить карточку закупки"""
+    def _release_card(self, card: TenderCard) -> None:
+        """Убирает карточку из списка: в пул, пока он не заполнен, иначе удаляет"""
+        self.cards_layout.removeWidget(card)
+        if len(self._card_pool) < self.CARD_POOL_LIMIT:
+            card.hide()
+            card.set_selected(False)
+            self._card_pool.append(card)
+        else:
+            card.deleteLater()
+    
+    def add_tender_card(
+        self,
+        tender_data: Dict[str, Any],
+        match_summary: Any = MISS,
+    ):
+        """Добавить карточку закупки (match_summary - заранее загруженная сводка, MISS - не загружена)"""
         try:
-            card = TenderCard(
-                tender_data,
-                document_search_service=self.document_search_service,
-                tender_match_repository=self.tender_match_repository,
-                parent=self,
-            )
-            # Подключаем сигнал изменения выбора
-            if hasattr(card, 'selection_changed'):
-                card.selection_changed.connect(self._on_card_selection_changed)
+            if self._card_pool:
+                # Сигнал выбора у карточки из пула уже подключен
+                card = self._card_pool.pop()
+                card.rebind(tender_data, match_summary)
+            else:
+                card = TenderCard(
+                    tender_data,
+                    document_search_service=self.document_search_service,
+                    tender_match_repository=self.tender_match_repository,
+                    parent=self,
+                    initial_match_summary=match_summary,
+                )
+                # Подключаем сигнал изменения выбора
+                if hasattr(card, 'selection_changed'):
+                    card.selection_changed.connect(self._on_card_selection_changed)
             self.tender_cards.append(card)
             self.cards_layout.addWidget(card)
+            card.show()
         except Exception as e:
             logger.error(f"Ошибка при создании карточки закупки: {e}")
             logger.error(f"Данные закупки: {tender_data.get('id', 'нет ID')}")
     
-    def _load_match_summaries_batch(self, tenders: List[Dict[str, Any]]) -> Dict[tuple, Dict[str, Any]]:
+    def _load_match_summaries_batch(self, tenders: List[Dict[str, Any]]) -> Dict[tuple, Optional[Dict[str, Any]]]:
         """
         Загрузка всех match_summary батчем для оптимизации
         
         Returns:
-            Словарь {(tender_id, registry_type): match_summary}
+            Словарь {(tender_id, registry_type): match_summary}; None - закупка не
+            обработана. Закупок реестра, запрос по которому не удался, в словаре нет
         """
         if not self.tender_match_repository or not tenders:
             return {}
@@ -148,58 +200,49 @@ class TenderListWidget(QWidget):
             if not tender_id:
                 continue
             
-            registry_type = '44fz'  # По умолчанию
-            if 'registry_type' in tender:
-                registry_type = tender['registry_type']
-            elif 'platform' in tender:
-                platform = str(tender['platform']).lower()
-                if '223' in platform or 'закон' in platform:
-                    registry_type = '223fz'
+            registry_type = determine_registry_type(tender)
             
             if registry_type not in tenders_by_registry:
                 tenders_by_registry[registry_type] = []
             tenders_by_registry[registry_type].append(tender_id)
         
-        # Загружаем батчем для каждого registry_type
+        # Загружаем сводки батчем для каждого registry_type (один запрос на реестр)
         cache = {}
         for registry_type, tender_ids in tenders_by_registry.items():
             try:
-                # Загружаем match_results батчем
-                match_results = self.tender_match_repository.get_match_results_batch(tender_ids, registry_type)
-                
-                # Для каждого результата вычисляем summary
-                for tender_id, match_result in match_results.items():
-                    # Вычисляем summary локально (аналогично get_match_summary)
-                    match_summary = self._compute_match_summary(match_result, tender_id, registry_type)
-                    if match_summary:
-                        cache[(tender_id, registry_type)] = match_summary
+                summaries = self.tender_match_repository.get_match_summaries_batch(tender_ids, registry_type)
             except Exception as e:
-                logger.error(f"Ошибка при батч-загрузке match_results для {registry_type}: {e}")
-        
+                summaries = None
+                logger.error(f"Ошибка при батч-загрузке match_summary для {registry_type}: {e}")
+            if summaries is None:
+                # Без записи в кэш карточки запросят сводку сами, а не покажут «не обработано»
+                continue
+            for tender_id in tender_ids:
+                cache[(tender_id, registry_type)] = summaries.get(tender_id)
+        
+        # Одна сводная запись вместо логирования в каждой карточке
+        processed = [summary for summary in cache.values() if summary]
+        logger.debug(
+            "Сводки совпадений: обработано {} из {} (exact={}, good={}, без совпадений={})",
+            len(processed),
+            len(tenders),
+            sum(1 for summary in processed if summary.get('exact_count')),
+            sum(1 for summary in processed if summary.get('good_count')),
+            sum(1 for summary in processed if not summary.get('total_count')),
+        )
         return cache
     
-    def _compute_match_summary(self, match_result: Dict[str, Any], tender_id: int, registry_type: str) -> Optional[Dict[str, Any]]:
-        """Вычисление match_summary из match_result (локально, без запросов к БД)"""
-        if not match_result:
-            return None
-        
-        # Для упрощения, если нет детальной информации о совпадениях, используем match_percentage
-        match_percentage = match_result.get('match_percentage', 0)
-        match_count = match_result.get('match_count', 0)
-        
-        # Определяем типы совпадений на основе процента
-        exact_count = 1 if match_percentage >= 100 else 0
-        good_count = 1 if 85 <= match_percentage < 100 else 0
-        brown_count = 1 if 56 <= match_percentage < 85 else 0
+    def _cached_card_summary(self, tender: Dict[str, Any], cache: Dict[tuple, Optional[Dict[str, Any]]]) -> Any:
+        """
+        Сводка из батч-кэша для карточки.
         
-        return {
-            'match_result': match_result,
-            'exact_count': exact_count,
-            'good_count': good_count,
-            'brown_count': brown_count,
-            'total_count': match_count,
-            'error_reason': match_result.get('error_reason'),
-        }
+        None в кэше означает «не обработано». Если ключа нет (батч-запрос не
+        удался) или нет репозитория, возвращается MISS - карточка определит
+        сводку сама.
+        """
+        if not self.tender_match_repository:
+            return MISS
+        return cache.get((tender.get('id'), determine_registry_type(tender)), MISS)
     
     def _get_tender_priority_cached(self, tender: Dict[str, Any], cache: Dict[tuple, Dict[str, Any]]) -> int:
         """Получение приоритета тендера с использованием кэша"""
@@ -207,14 +250,8 @@ class TenderListWidget(QWidget):
         if not tender_id:
             return 999
         
-        # Определяем registry_type
-        registry_type = '44fz'  # По умолчанию
-        if 'registry_type' in tender:
-            registry_type = tender['registry_type']
-        elif 'platform' in tender:
-            platform = str(tender['platform']).lower()
-            if '223' in platform or 'закон' in platform:
-                registry_type = '223fz'
+        # Тот же registry_type, что использует карточка
+        registry_type = determine_registry_type(tender)
         
         # Получаем из кэша
         match_summary = cache.get((tender_id, registry_type))
@@ -271,13 +308,7 @@ class TenderListWidget(QWidget):
         if self.tender_match_repository:
             try:
                 # Определяем тип реестра из данных тендера
-                registry_type = '44fz'  # По умолчанию
-                if 'registry_type' in tender:
-                    registry_type = tender['registry_type']
-                elif 'platform' in tender:
-                    platform = str(tender['platform']).lower()
-                    if '223' in platform or 'закон' in platform:
-                        registry_type = '223fz'
+                registry_type = determine_registry_type(tender)
                 
                 match_summary = self.tender_match_repository.get_match_summary(tender_id, registry_type)
             except Exception as e:
@@ -354,10 +385,12 @@ class TenderListWidget(QWidget):
             pass
         # #endregion
         
-        self.hide_loading()
-        
         if not tenders:
+            self.hide_loading()
+            # Отменяем применение ещё не завершенной подготовки
+            self._prepare_generation += 1
             # Если нет торгов - очищаем все карточки
+            self._use_list_view(False)
             self.clear_cards()
             # Скрываем счетчик
             if self.count_info:
@@ -369,11 +402,29 @@ class TenderListWidget(QWidget):
             self.cards_layout.addWidget(no_data_label)
             return
         
+        # Батч-загрузка сводок и сортировка выполняются в пуле потоков,
+        # карточки синхронизируются в GUI-потоке (_on_tenders_prepared).
+        # Результаты устаревших вызовов отбрасываются по номеру поколения.
+        self._prepare_generation += 1
+        self._pending_total_count = total_count
+        self._pending_start_time = start_time
+        task = TenderPrepareTask(self._prepare_generation, tenders, self._prepare_tenders)
+        task.signals.finished.connect(self._on_tenders_prepared)
+        QThreadPool.globalInstance().start(task)
+    
+    def _prepare_tenders(self, tenders: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Подготовка списка закупок (выполняется в пуле потоков, виджеты не трогает).
+        
+        Returns:
+            Словарь с отсортированными торгами, кэшем сводок и временем этапов
+        """
+        import time
+        
         # Оптимизация: загружаем все match_summary батчем
         batch_load_start = time.time()
         match_summaries_cache = self._load_match_summaries_batch(tenders)
         batch_load_time = time.time() - batch_load_start
-        sort_time = 0.0  # Инициализируем для случая, если сортировка не выполнится
         
         # #region agent log
         try:
@@ -401,6 +452,83 @@ class TenderListWidget(QWidget):
         sorted_tenders = sorted(tenders, key=lambda t: self._get_tender_priority_cached(t, match_summaries_cache))
         sort_time = time.time() - sort_start
         
+        # Строки цены и даты карточек форматируются здесь, а не при создании карточек
+        prewarm_card_formatting(sorted_tenders)
+        
+        # Детали для превью первых карточек грузим здесь же, пока GUI-поток свободен
+        prefetch_match_details(
+            self.tender_match_repository, sorted_tenders, match_summaries_cache,
+            self.PREFETCH_DETAILS_COUNT, TenderCard.MATCH_DETAILS_CACHE_LIMIT
+        )
+        
+        return {
+            'sorted_tenders': sorted_tenders,
+            'match_summaries_cache': match_summaries_cache,
+            'batch_load_time': batch_load_time,
+            'sort_time': sort_time,
+        }
+    
+    def _on_tenders_prepared(self, generation: int, prepared: Optional[Dict[str, Any]]):
+        """Синхронизация карточек с подготовленным списком (GUI-поток)"""
+        if generation != self._prepare_generation:
+            return  # Пока шла подготовка, был запрошен новый список
+        self.hide_loading()
+        if prepared is None:
+            return
+        sorted_tenders = prepared['sorted_tenders']
+        if len(sorted_tenders) >= self.LIST_VIEW_THRESHOLD:
+            self._show_in_list_view(sorted_tenders, prepared['match_summaries_cache'])
+            return
+        self._use_list_view(False)
+        self._sync_cards(
+            prepared['sorted_tenders'],
+            prepared['match_summaries_cache'],
+            self._pending_total_count,
+            self._pending_start_time,
+            prepared['batch_load_time'],
+            prepared['sort_time'],
+        )
+    
+    def _use_list_view(self, enabled: bool) -> None:
+        """Переключение между списком на делегате и карточками-виджетами"""
+        if not enabled and self._list_view_active:
+            self.list_view.set_tenders([])
+        self._list_view_active = enabled
+        self.list_view.setVisible(enabled)
+        self.scroll_area.setVisible(not enabled)
+    
+    def _show_in_list_view(
+        self,
+        sorted_tenders: List[Dict[str, Any]],
+        match_summaries_cache: Dict[tuple, Dict[str, Any]],
+    ) -> None:
+        """Показ длинного списка через TenderListView (карточки-виджеты удаляются)"""
+        self.clear_cards()
+        self.list_view.set_tenders(sorted_tenders, match_summaries_cache)
+        self._use_list_view(True)
+        self._update_count_info(len(sorted_tenders), self._pending_total_count)
+        logger.info(f"Список закупок показан через делегат: {len(sorted_tenders)} строк")
+    
+    def _update_count_info(self, loaded_count: int, total_count: Optional[int]) -> None:
+        """Обновление счетчика загруженных закупок (вверху)"""
+        if total_count and total_count > loaded_count:
+            self.count_info.setText(f"Загружено закупок: {loaded_count} из {total_count}")
+        else:
+            self.count_info.setText(f"Загружено закупок: {loaded_count}")
+        self.count_info.show()
+    
+    def _sync_cards(
+        self,
+        sorted_tenders: List[Dict[str, Any]],
+        match_summaries_cache: Dict[tuple, Dict[str, Any]],
+        total_count: Optional[int],
+        start_time: float,
+        batch_load_time: float,
+        sort_time: float,
+    ):
+        """Создание, обновление и удаление карточек по отсортированному списку"""
+        import time
+        
         # Создаем словарь существующих карточек по tender_id
         existing_cards = {card.tender_data.get('id'): card for card in self.tender_cards}
         
@@ -480,8 +608,7 @@ class TenderListWidget(QWidget):
         
         # Удаляем карточки
         for card in cards_to_remove:
-            self.cards_layout.removeWidget(card)
-            card.deleteLater()
+            self._release_card(card)
             if card in self.tender_cards:
                 self.tender_cards.remove(card)
             # Удаляем из словаря существующих
@@ -531,24 +658,20 @@ class TenderListWidget(QWidget):
                     pass
                 # #endregion
                 try:
-                    card.update_status()
+                    card.update_status(self._cached_card_summary(tender, match_summaries_cache))
                     updated_count += 1
                 except Exception as e:
                     logger.error(f"Ошибка при обновлении карточки закупки ID {tender_id}: {e}")
             else:
                 # Создаем новую карточку
                 try:
-                    self.add_tender_card(tender)
+                    self.add_tender_card(tender, self._cached_card_summary(tender, match_summaries_cache))
                     created_count += 1
                 except Exception as e:
                     logger.error(f"Ошибка при создании карточки закупки ID {tender_id}: {e}")
         
         # Обновляем информацию о количестве загруженных закупок (вверху)
-        if total_count and total_count > len(sorted_tenders):
-            self.count_info.setText(f"Загружено закупок: {len(sorted_tenders)} из {total_count}")
-        else:
-            self.count_info.setText(f"Загружено закупок: {len(sorted_tenders)}")
-        self.count_info.show()
+        self._update_count_info(len(sorted_tenders), total_count)
         
         total_time = time.time() - start_time
         
@@ -621,6 +744,8 @@ class TenderListWidget(QWidget):
     
     def get_selected_tenders(self) -> List[Dict[str, Any]]:
         """Получить список выбранных закупок"""
+        if self._list_view_active:
+            return self.list_view.selected_tenders()
         selected = []
         for card in self.tender_cards:
             if hasattr(card, 'is_selected') and card.is_selected:
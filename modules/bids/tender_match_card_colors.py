@@ -1,18 +1,19 @@
-"""Модуль для определения цветов карточек совпадений по score."""
+"""Модуль для определения варианта оформления карточек совпадений по score."""
 
-def get_match_card_colors(score: float) -> tuple:
+
+def get_match_card_variant(score: float) -> str:
     """
-    Возвращает цвета для карточки совпадения в зависимости от score.
+    Возвращает вариант карточки совпадения (свойство matchCard) по score.
     
     Returns:
-        (border_color, bg_color, text_color) - кортеж из трех цветов
+        Ключ MATCH_CARD_COLORS: 'exact', 'good', 'brown' или 'low'
     """
     if score >= 100.0:
-        return ("#28a745", "#d4edda", "#155724")
+        return 'exact'
     elif score >= 85.0:
-        return ("#ffc107", "#fff3cd", "#856404")
+        return 'good'
     elif score >= 56.0:
-        return ("#8B4513", "#F4E4C1", "#5D2F0A")
+        return 'brown'
     else:
-        return ("#6c757d", "#e9ecef", "#495057")
+        return 'low'
 
@@ -1,27 +1,22 @@
 """Модуль для создания деталей совпадений в карточке закупки."""
 
-from typing import Any, Dict, List, Optional
-from PyQt5.QtWidgets import QFrame, QVBoxLayout, QLabel, QWidget
-from modules.styles.general_styles import (
-    apply_label_style, apply_text_style_light, apply_text_color, apply_font_weight
-)
-from modules.styles.general_styles import apply_frame_style
+from typing import Any, Dict, Optional, Sequence
+from PyQt5.QtWidgets import QFrame, QLabel, QWidget
+
+from modules.bids.tender_card_utils import make_framed_vbox
 
 
 def create_match_summary_block(match_summary: Optional[Dict[str, Any]]) -> QFrame:
     """Создание блока сводки по совпадениям."""
-    frame = QFrame()
-    layout = QVBoxLayout(frame)
-    layout.setSpacing(6)
+    frame, layout = make_framed_vbox(6)
     
     title = QLabel("Результаты анализа документов")
-    apply_label_style(title, 'h2')
+    title.setProperty("textStyle", "h2")
     layout.addWidget(title)
     
     if not match_summary:
         empty_label = QLabel("Документы по закупке ещё не обработаны.")
-        apply_label_style(empty_label, 'normal')
-        apply_text_style_light(empty_label)
+        empty_label.setProperty("textStyle", "light")
         layout.addWidget(empty_label)
         return frame
     
@@ -31,62 +26,50 @@ def create_match_summary_block(match_summary: Optional[Dict[str, Any]]) -> QFram
         f"56%-85% совпадения: {match_summary.get('brown_count', 0)}\n"
         f"Всего совпадений: {match_summary.get('total_count', 0)}"
     )
-    apply_label_style(summary_text, 'normal')
+    summary_text.setProperty("textStyle", "normal")
     layout.addWidget(summary_text)
     return frame
 
 
 def create_match_detail_card(detail: Dict[str, Any]) -> QWidget:
     """Создание карточки одного совпадения."""
-    card = QFrame()
-    layout = QVBoxLayout(card)
-    layout.setSpacing(4)
+    from modules.bids.tender_match_card_colors import get_match_card_variant
+    # Поля совпадения читаем один раз; метки создаются только для заполненных полей
+    data = detail.get
+    product_name = data('product_name') or "Без названия"
+    score = data('score') or 0
+    sheet = data('sheet_name')
+    cell = data('cell_address')
+    source = data('source_file')
+    snippet = data("matched_display_text") or data("matched_text")
+    # Рамка, фон и цвет текста задаются общей таблицей стилей по свойству matchCard
+    card, layout = make_framed_vbox(4, matchCard=get_match_card_variant(score))
     layout.setContentsMargins(8, 8, 8, 8)
-    
-    from modules.bids.tender_match_card_colors import get_match_card_colors
-    product_name = detail.get('product_name') or "Без названия"
-    score = detail.get('score') or 0
-    border_color, bg_color, text_color = get_match_card_colors(score)
-    
-    card.setStyleSheet(
-        f"QFrame {{"
-        f"  border: 2px solid {border_color};"
-        f"  background-color: {bg_color};"
-        f"  border-radius: 6px;"
-        f"  padding: 4px;"
-        f"}}"
-    )
+    add_widget = layout.addWidget
     
     header = QLabel(f"{product_name} — {score:.0f}%")
-    apply_label_style(header, 'normal')
-    apply_font_weight(header)
-    header.setStyleSheet(f"color: {text_color};")
-    layout.addWidget(header)
+    header.setProperty("textStyle", "strong")
+    add_widget(header)
     
-    sheet = detail.get('sheet_name') or "лист"
-    cell = detail.get('cell_address') or ""
-    location = QLabel(f"{sheet} {cell}".strip())
-    apply_label_style(location, 'small')
-    location.setStyleSheet(f"color: {text_color};")
-    layout.addWidget(location)
+    if sheet or cell:
+        sheet = sheet or "лист"
+        location = QLabel(f"{sheet} {cell}" if cell else sheet)
+        location.setProperty("textStyle", "small")
+        add_widget(location)
     
-    source = detail.get('source_file')
     if source:
         source_label = QLabel(f"Файл: {source}")
-        apply_label_style(source_label, 'small')
-        source_label.setStyleSheet(f"color: {text_color};")
-        layout.addWidget(source_label)
+        source_label.setProperty("textStyle", "small")
+        add_widget(source_label)
     
-    snippet = detail.get("matched_display_text") or detail.get("matched_text")
     if snippet:
         snippet_label = QLabel(f"Фрагмент: {snippet}")
         snippet_label.setWordWrap(True)
-        apply_label_style(snippet_label, "small")
-        snippet_label.setStyleSheet(f"color: {text_color};")
-        layout.addWidget(snippet_label)
+        snippet_label.setProperty("textStyle", "small")
+        add_widget(snippet_label)
 
     # Для Excel‑смет: показываем строку с заголовками столбцов и значениями
-    row_data = detail.get("row_data") or {}
+    row_data = data("row_data") or {}
     full_row = row_data.get("full_row") or []
     if full_row:
         # Берём только ячейки с непустым значением и названием столбца
@@ -103,38 +86,42 @@ def create_match_detail_card(detail: Dict[str, Any]) -> QWidget:
         if excel_cells:
             excel_label = QLabel("Строка сметы:\n" + "\n".join(excel_cells))
             excel_label.setWordWrap(True)
-            apply_label_style(excel_label, "small")
-            excel_label.setStyleSheet(f"color: {text_color};")
-            layout.addWidget(excel_label)
+            excel_label.setProperty("textStyle", "small")
+            add_widget(excel_label)
     
     return card
 
 
-def create_match_details_block(details: List[Dict[str, Any]]) -> QFrame:
+def create_match_details_block(details: Sequence[Dict[str, Any]]) -> QFrame:
     """Создание блока с деталями совпадений."""
-    frame = QFrame()
-    layout = QVBoxLayout(frame)
-    layout.setSpacing(8)
+    frame, layout = make_framed_vbox(8)
     
     title = QLabel("Найденные товары")
-    apply_label_style(title, 'h2')
+    title.setProperty("textStyle", "h2")
     layout.addWidget(title)
     
     if not details:
         empty_label = QLabel("Совпадения ещё не обнаружены.")
-        apply_label_style(empty_label, 'normal')
-        apply_text_style_light(empty_label)
+        empty_label.setProperty("textStyle", "light")
         layout.addWidget(empty_label)
         return frame
     
     from modules.bids.tender_match_details_groups import add_match_group
-    green_matches = [d for d in details if d.get('score', 0) >= 100.0]
-    yellow_matches = [d for d in details if 85.0 <= d.get('score', 0) < 100.0]
-    brown_matches = [d for d in details if 56.0 <= d.get('score', 0) < 85.0]
+    # Раскладываем совпадения по группам за один проход
+    green_matches, yellow_matches, brown_matches = [], [], []
+    add_green, add_yellow, add_brown = green_matches.append, yellow_matches.append, brown_matches.append
+    for detail in details:
+        score = detail.get('score', 0)
+        if score >= 100.0:
+            add_green(detail)
+        elif score >= 85.0:
+            add_yellow(detail)
+        elif score >= 56.0:
+            add_brown(detail)
     
-    add_match_group(layout, green_matches, "🟢", "100% совпадения", '#155724', create_match_detail_card)
-    add_match_group(layout, yellow_matches, "🟡", "85%-100% совпадения", '#856404', create_match_detail_card)
-    add_match_group(layout, brown_matches, "🟤", "56%-85% совпадения", '#5D2F0A', create_match_detail_card)
+    add_match_group(layout, green_matches, "🟢", "100% совпадения", 'exact', create_match_detail_card)
+    add_match_group(layout, yellow_matches, "🟡", "85%-100% совпадения", 'good', create_match_detail_card)
+    add_match_group(layout, brown_matches, "🟤", "56%-85% совпадения", 'brown', create_match_detail_card)
     
     return frame
 
@@ -2,7 +2,6 @@
 
 from typing import Any, Dict, List
 from PyQt5.QtWidgets import QLabel, QVBoxLayout
-from modules.styles.general_styles import apply_label_style, apply_text_color
 
 
 def add_match_group(
@@ -10,17 +9,18 @@ def add_match_group(
     matches: List[Dict[str, Any]],
     title_emoji: str,
     title_text: str,
-    text_color: str,
+    variant: str,
     create_card_func
 ):
-    """Добавляет группу совпадений в layout"""
+    """Добавляет группу совпадений в layout (variant - ключ MATCH_CARD_COLORS)"""
     if not matches:
         return
     title = QLabel(f"{title_emoji} {title_text} ({len(matches)})")
-    apply_label_style(title, 'h3')
-    apply_text_color(title, text_color)
+    title.setProperty("textStyle", "h3")
+    title.setProperty("matchGroup", variant)
     layout.addWidget(title)
+    add_widget = layout.addWidget
     for detail in matches:
-        layout.addWidget(create_card_func(detail))
+        add_widget(create_card_func(detail))
     layout.addSpacing(12)
 
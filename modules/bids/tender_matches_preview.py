@@ -2,12 +2,12 @@
 Модуль для создания превью совпадений в карточке закупки.
 """
 
+import html
 from typing import Dict, Any, List, Optional
 from PyQt5.QtWidgets import QFrame, QVBoxLayout, QLabel, QWidget
+from PyQt5.QtCore import Qt
 
-from modules.styles.general_styles import (
-    apply_label_style, apply_text_style_light, apply_frame_style, apply_font_weight
-)
+from modules.bids.tender_card_utils import plain_label
 
 
 def get_score_color(score: float) -> tuple:
@@ -35,28 +35,28 @@ def create_matches_preview(
     if not summary:
         return None
     
+    # Оформление задается общей таблицей стилей карточки (TENDER_MATCHES_PREVIEW_STYLE)
     container = QFrame()
-    apply_frame_style(container, 'secondary')
+    container.setProperty("role", "preview")
     layout = QVBoxLayout(container)
     layout.setSpacing(6)
     layout.setContentsMargins(0, 0, 0, 0)
     
-    title = QLabel("Совпадения по документам")
-    apply_label_style(title, 'h3')
-    apply_font_weight(title)
+    title = plain_label("Совпадения по документам")
+    title.setProperty("role", "previewTitle")
     layout.addWidget(title)
     
-    stats_label = QLabel(
+    stats_label = plain_label(
         f"100%: {summary.get('exact_count', 0)} • "
         f"85%: {summary.get('good_count', 0)} • "
         f"Всего: {summary.get('total_count', 0)}"
     )
-    apply_label_style(stats_label, 'normal')
-    apply_text_style_light(stats_label)
+    stats_label.setProperty("role", "previewStats")
     layout.addWidget(stats_label)
     
     details = fetch_match_details_func(limit=3)
     if details:
+        rows = []
         for detail in details:
             product_name = detail.get('product_name') or "Без названия"
             score = detail.get('score') or 0
@@ -64,20 +64,22 @@ def create_matches_preview(
             cell = detail.get('cell_address') or ""
             
             bg_color, text_color = get_score_color(score)
-            item_label = QLabel(f"• {product_name} — {score:.0f}% ({sheet} {cell})")
-            apply_label_style(item_label, 'normal')
-            from modules.styles.general_styles import scale_size
-            item_label.setStyleSheet(
-                item_label.styleSheet() + 
-                f"background-color: {bg_color}; "
-                f"color: {text_color}; "
-                f"padding: {scale_size(6)}px; "
-                f"border-radius: {scale_size(4)}px;"
+            # Все строки выводятся одной rich-text меткой, на строку - только цвета и текст
+            location = f"{sheet} {cell}" if cell else sheet
+            item_text = html.escape(f"{product_name} — {score:.0f}% ({location})")
+            rows.append(
+                f'<div style="background-color: {bg_color}; color: {text_color};">'
+                f'&nbsp;• {item_text}&nbsp;</div>'
             )
-            layout.addWidget(item_label)
+        items_label = QLabel()
+        items_label.setTextFormat(Qt.RichText)
+        items_label.setText("".join(rows))
+        items_label.setWordWrap(True)
+        items_label.setProperty("role", "previewText")
+        layout.addWidget(items_label)
     else:
-        empty_label = QLabel("Документы обработаны, но совпадения не найдены.")
-        apply_label_style(empty_label, 'normal')
+        empty_label = plain_label("Документы обработаны, но совпадения не найдены.")
+        empty_label.setProperty("role", "previewText")
         layout.addWidget(empty_label)
     
     return container
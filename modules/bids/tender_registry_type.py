@@ -5,11 +5,8 @@ from typing import Dict, Any
 
 def determine_registry_type(tender_data: Dict[str, Any]) -> str:
     """Определяет тип реестра (44ФЗ/223ФЗ) для именования папок"""
-    raw_value = (
-        tender_data.get('registry_type')
-        or tender_data.get('law')
-        or ''
-    )
-    value = str(raw_value).lower()
-    return '223fz' if '223' in value else '44fz'
-
+    raw = tender_data.get('registry_type') or tender_data.get('law') or ''
+    # '223' не зависит от регистра: lower() не нужен, str() - только для нестроковых значений
+    if not isinstance(raw, str):
+        raw = str(raw)
+    return '223fz' if '223' in raw else '44fz'
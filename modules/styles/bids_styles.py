@@ -2,7 +2,13 @@
 Специализированные стили для модулей заявок (bids).
 """
 
-from modules.styles.general_styles import COLORS, SIZES, FONT_SIZES
+from PyQt5.QtWidgets import QApplication
+
+from modules.styles.general_styles import (
+    COLORS, SIZES, FONT_SIZES, FONT_FAMILY, LABEL_STYLES, BUTTON_STYLES, FRAME_STYLES,
+    SCROLL_AREA_STYLES
+)
+from modules.styles.scaling import scale_size
 
 
 TENDER_CARD_STYLE = f"""
@@ -19,27 +25,198 @@ TENDER_CARD_STYLE = f"""
 """
 
 CHECKBOX_STYLE = f"""
-    QCheckBox {{
+    TenderCard QCheckBox {{
         spacing: {SIZES['padding_normal']}px;
     }}
-    QCheckBox::indicator {{
+    TenderCard QCheckBox::indicator {{
         width: {int(SIZES['button_height'] * 1.3)}px;
         height: {int(SIZES['button_height'] * 1.3)}px;
         border: 2px solid {COLORS['border']};
         border-radius: {int(SIZES['button_height'] * 1.3) // 2}px;
         background: {COLORS['white']};
     }}
-    QCheckBox::indicator:checked {{
+    TenderCard QCheckBox::indicator:checked {{
         background: {COLORS['primary']};
         border: 2px solid {COLORS['primary']};
     }}
-    QCheckBox::indicator:checked::after {{
+    TenderCard QCheckBox::indicator:checked::after {{
         content: "★";
         color: {COLORS['white']};
         font-size: {FONT_SIZES['large']};
     }}
 """
 
+# Варианты значков статуса: badge -> (цвет текста, цвет фона)
+STATUS_BADGE_COLORS = {
+    'unprocessed': ("#dc3545", "#fff3cd"),
+    'error': ("#dc3545", "#f8d7da"),
+    'parse_error': ("#007bff", "#cfe2ff"),
+    'exact': ("#28a745", "#d4edda"),
+    'good': ("#ffc107", "#fff3cd"),
+    'brown': ("#8B4513", "#F4E4C1"),
+    'none': ("#dc3545", "#f8d7da"),
+}
+
+# Подсветка карточки при ошибке обработки: status -> (цвет рамки, цвет фона)
+TENDER_CARD_STATUS_COLORS = {
+    'error': ("#dc3545", "#fff5f5"),
+    'parse_error': ("#007bff", "#e7f3ff"),
+}
+
+STATUS_BADGE_STYLE = "".join(
+    f"""
+    QLabel[badge="{variant}"] {{
+        color: {text_color};
+        font-weight: bold;
+        font-size: {FONT_SIZES['normal']};
+        padding: {SIZES['padding_small']}px {SIZES['padding_normal']}px;
+        background: {background_color};
+        border-radius: {SIZES['border_radius_small']}px;
+    }}
+"""
+    for variant, (text_color, background_color) in STATUS_BADGE_COLORS.items()
+)
+
+TENDER_CARD_STATUS_STYLE = "".join(
+    f"""
+    TenderCard[status="{status}"] {{
+        border: 3px solid {border_color};
+        background-color: {background_color};
+        border-radius: 8px;
+    }}
+"""
+    for status, (border_color, background_color) in TENDER_CARD_STATUS_COLORS.items()
+)
+
+TENDER_CARD_LABELS_STYLE = f"""
+    TenderCard QLabel[role="name"] {{ {LABEL_STYLES['h2']} font-weight: 600; }}
+    TenderCard QLabel[role="info"] {{ color: {COLORS['text_light']}; }}
+    TenderCard QLabel[role="price"] {{ color: {COLORS['primary']}; font-weight: 600; }}
+    TenderCard QLabel[textStyle="small"] {{ {LABEL_STYLES['small']} }}
+"""
+
+# Превью совпадений в карточке: фон рамки (как FRAME_STYLES['secondary']) действует
+# и на метки внутри, как при setStyleSheet на контейнере
+TENDER_MATCHES_PREVIEW_STYLE = FRAME_STYLES['secondary'].replace(
+    'QFrame', 'TenderCard QFrame[role="preview"], TenderCard QFrame[role="preview"] QLabel', 1
+) + f"""
+    TenderCard QFrame[role="preview"] QLabel[role="previewTitle"] {{ {LABEL_STYLES['h3']} font-weight: 600; }}
+    TenderCard QFrame[role="preview"] QLabel[role="previewStats"] {{ color: {COLORS['text_light']}; }}
+    TenderCard QFrame[role="preview"] QLabel[role="previewText"] {{ {LABEL_STYLES['normal']} }}
+"""
+
+# Цвета карточек совпадений в диалоге закупки: matchCard -> (рамка, фон, текст)
+MATCH_CARD_COLORS = {
+    'exact': ("#28a745", "#d4edda", "#155724"),
+    'good': ("#ffc107", "#fff3cd", "#856404"),
+    'brown': ("#8B4513", "#F4E4C1", "#5D2F0A"),
+    'low': ("#6c757d", "#e9ecef", "#495057"),
+}
+
+
+def _scoped_style(style: str, widget_type: str, selector: str) -> str:
+    """Переносит готовый стиль виджета (BUTTON_STYLES, FRAME_STYLES) на селектор."""
+    return style.replace(widget_type, selector)
+
+
+# Секции, кнопки и метки диалога: вместо setStyleSheet на каждом виджете
+# виджеты помечаются динамическими свойствами (detailRole, buttonStyle, textStyle)
+TENDER_DETAIL_STYLE = (
+    _scoped_style(
+        SCROLL_AREA_STYLES['card'], 'QScrollArea', 'TenderDetailDialog QScrollArea[detailRole="content"]'
+    )
+    + _scoped_style(
+        FRAME_STYLES['secondary'], 'QFrame', 'TenderDetailDialog QFrame[detailRole="section"]'
+    )
+    + f"""
+    TenderDetailDialog QFrame[detailRole="section"] QLabel {{
+        padding: {scale_size(12)}px {scale_size(16)}px;
+    }}
+"""
+    + "".join(
+        _scoped_style(
+            BUTTON_STYLES[variant], 'QPushButton', f'TenderDetailDialog QPushButton[buttonStyle="{variant}"]'
+        )
+        for variant in ('primary', 'secondary')
+    )
+    + "".join(
+        f"""
+    TenderDetailDialog QLabel[textStyle="{variant}"] {{ {LABEL_STYLES[variant]} }}
+"""
+        for variant in ('h1', 'h2', 'h3', 'normal', 'small')
+    )
+    + f"""
+    TenderDetailDialog QListView[detailRole="docs"] {{
+        background: transparent;
+        border: none;
+        font-family: "{FONT_FAMILY}";
+        font-size: {FONT_SIZES['normal']};
+    }}
+    TenderDetailDialog QListView[detailRole="docs"]::item {{
+        color: {COLORS['text_dark']};
+        border: 1px solid {COLORS['border']};
+        border-radius: {SIZES['border_radius_small']}px;
+        padding: 3px 8px;
+        min-height: {SIZES['button_height'] - 4}px;
+    }}
+    TenderDetailDialog QListView[detailRole="docs"]::item:hover {{
+        background: {COLORS['secondary']};
+        border-color: {COLORS['primary']};
+    }}
+"""
+    + f"""
+    TenderDetailDialog QLabel[textStyle="strong"] {{ {LABEL_STYLES['normal']} font-weight: 600; }}
+    TenderDetailDialog QLabel[textStyle="light"] {{ color: {COLORS['text_light']}; }}
+    TenderDetailDialog QFrame[detailRole="separator"] {{ color: {COLORS['border']}; }}
+"""
+)
+
+MATCH_CARD_STYLE = "".join(
+    f"""
+    TenderDetailDialog QFrame[matchCard="{variant}"] {{
+        border: 2px solid {border_color};
+        background-color: {background_color};
+        border-radius: 6px;
+        padding: 4px;
+    }}
+    TenderDetailDialog QFrame[matchCard="{variant}"] QLabel {{
+        color: {text_color};
+        padding: 0px;
+    }}
+    TenderDetailDialog QLabel[matchGroup="{variant}"] {{
+        color: {text_color};
+    }}
+"""
+    for variant, (border_color, background_color, text_color) in MATCH_CARD_COLORS.items()
+)
+
+# Карточки совпадений в диалоге результатов поиска: рамка как FRAME_STYLES['card']
+# действует и на метки внутри, как при setStyleSheet на каждой рамке
+DOCUMENT_SEARCH_RESULT_STYLE = FRAME_STYLES['card'].replace(
+    'QFrame',
+    'DocumentSearchResultDialog QFrame[resultRole="match"], '
+    'DocumentSearchResultDialog QFrame[resultRole="match"] QLabel',
+    1
+) + f"""
+    DocumentSearchResultDialog QLabel[resultRole="header"] {{ {LABEL_STYLES['normal']} font-weight: 600; }}
+    DocumentSearchResultDialog QLabel[resultRole="normal"] {{ {LABEL_STYLES['normal']} }}
+    DocumentSearchResultDialog QLabel[resultRole="small"] {{ {LABEL_STYLES['small']} }}
+"""
+
+# Единая таблица стилей карточек и диалога закупки. Устанавливается один раз
+# на уровне приложения, варианты выбираются через objectName/динамические свойства.
+TENDER_CARD_GLOBAL_STYLE = (
+    TENDER_CARD_STYLE
+    + TENDER_CARD_STATUS_STYLE
+    + CHECKBOX_STYLE
+    + TENDER_CARD_LABELS_STYLE
+    + TENDER_MATCHES_PREVIEW_STYLE
+    + STATUS_BADGE_STYLE
+    + TENDER_DETAIL_STYLE
+    + MATCH_CARD_STYLE
+    + DOCUMENT_SEARCH_RESULT_STYLE
+)
+
 def get_badge_template() -> str:
     """(Устар.) Шаблон больше не используется напрямую."""
     return ""
@@ -55,31 +232,36 @@ BID_CARD_STYLE = f"""
         border: 2px solid {COLORS['primary']};
         box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1);
     }}
+    QLabel[role="number"] {{ color: {COLORS['primary']}; }}
+    QLabel[role="name"] {{ color: {COLORS['text_dark']}; }}
+    QLabel[role="date"] {{ color: {COLORS['text_light']}; }}
+    QLabel[role="amount"] {{ color: {COLORS['text_dark']}; font-weight: 600; }}
 """
 
 
-def apply_tender_card_style(widget):
-    widget.setStyleSheet(TENDER_CARD_STYLE)
-
+def install_tender_card_styles(app=None) -> None:
+    """
+    Устанавливает общую таблицу стилей карточек закупок на приложение.
 
-def apply_tender_checkbox_style(widget):
-    widget.setStyleSheet(CHECKBOX_STYLE)
+    Вызывается один раз при старте; повторный вызов ничего не делает.
+    """
+    app = app or QApplication.instance()
+    if app is None:
+        return
+    current_style = app.styleSheet() or ""
+    if TENDER_CARD_GLOBAL_STYLE in current_style:
+        return
+    app.setStyleSheet(current_style + TENDER_CARD_GLOBAL_STYLE)
 
 
-def apply_status_badge_style(widget, text_color, background_color):
-    """Применяет стиль бейджа без format() — напрямую через f-строку."""
-    widget.setStyleSheet(
-        f"""
-        QLabel {{
-            color: {text_color};
-            font-weight: bold;
-            font-size: {FONT_SIZES['normal']};
-            padding: {SIZES['padding_small']}px {SIZES['padding_normal']}px;
-            background: {background_color};
-            border-radius: {SIZES['border_radius_small']}px;
-        }}
-        """
-    )
+def set_style_variant(widget, name: str, value: str) -> None:
+    """Меняет динамическое свойство стиля и переприменяет стиль виджета."""
+    if (widget.property(name) or "") == value:
+        return
+    widget.setProperty(name, value)
+    style = widget.style()
+    style.unpolish(widget)
+    style.polish(widget)
 
 
 def apply_bid_card_style(widget):
@@ -1,7 +1,9 @@
 """
 Единые стили для всего приложения B2B AutoDesk с глобальным масштабированием
 """
+from functools import lru_cache
 from loguru import logger
+from PyQt5.QtGui import QFont
 from modules.styles.scaling  import scale_size, scale_font_size, get_scale_factor
 from config.settings import config
 
@@ -456,6 +458,24 @@ def apply_button_style(widget, style_type='primary'):
 def apply_input_style(widget, style_type='default'):
     widget.setStyleSheet(INPUT_STYLES.get(style_type, INPUT_STYLES['default']))
 
+# Роли текста, для которых LABEL_STYLES задает жирное начертание
+_BOLD_FONT_ROLES = frozenset({'h1', 'h2', 'h3', 'xlarge', 'xxlarge'})
+
+
+@lru_cache(maxsize=None)
+def get_font(role: str = 'normal') -> QFont:
+    """
+    Шрифт роли текста (FONT_FAMILY и размер из FONT_SIZES), создается один раз.
+
+    Нужен там, где текст рисуется без таблицы стилей (QPainter в делегатах).
+    Объект общий для всех вызовов: перед изменением его нужно скопировать.
+    """
+    font = QFont(FONT_FAMILY)
+    font.setPixelSize(int(FONT_SIZES.get(role, FONT_SIZES['normal'])[:-2]))
+    font.setBold(role in _BOLD_FONT_ROLES)
+    return font
+
+
 def apply_label_style(widget, style_type='normal'):
     """Применение стиля к метке с обработкой ошибок"""
     try:
@@ -529,8 +549,20 @@ def apply_text_edit_style(widget, style_type='log'):
 def apply_progress_bar_style(widget, style_type='primary'):
     widget.setStyleSheet(PROGRESS_BAR_STYLES.get(style_type, PROGRESS_BAR_STYLES['primary']))
 
+@lru_cache(maxsize=32)
+def _color_style(color: str) -> str:
+    """Строка стиля «только цвет текста» (одна на цвет за сессию)."""
+    return f"color: {color};"
+
+
+@lru_cache(maxsize=64)
+def _extended_style(current_style: str, extra: str) -> str:
+    """Текущий стиль виджета с добавленными свойствами (кэшируется по паре строк)."""
+    return f"{current_style} {extra}"
+
+
 def apply_separator_style(widget, color_type='border'):
-    widget.setStyleSheet(f"color: {COLORS.get(color_type, COLORS['border'])};")
+    widget.setStyleSheet(_color_style(COLORS.get(color_type, COLORS['border'])))
 
 # Вспомогательные функции для часто используемых стилей (DRY принцип)
 def apply_text_color(widget, color_type: str = 'text_light') -> None:
@@ -549,7 +581,7 @@ def apply_text_color(widget, color_type: str = 'text_light') -> None:
     color = COLORS.get(color_type, COLORS['text_light'])
     # Устанавливаем только цвет текста. Если нужен сложный стиль,
     # он должен задаваться через apply_label_style / apply_*_style.
-    widget.setStyleSheet(f"color: {color};")
+    widget.setStyleSheet(_color_style(color))
 
 def apply_font_weight(widget, weight='600'):
     """
@@ -560,7 +592,7 @@ def apply_font_weight(widget, weight='600'):
         weight: Вес шрифта ('600', 'bold', 'normal')
     """
     current_style = widget.styleSheet() or ""
-    widget.setStyleSheet(f"{current_style} font-weight: {weight};")
+    widget.setStyleSheet(_extended_style(current_style, f"font-weight: {weight};"))
 
 def apply_text_style_light(widget):
     """Быстрое применение стиля светлого текста."""
@@ -574,6 +606,9 @@ def apply_text_style_primary(widget):
     """Быстрое применение стиля основного цвета."""
     apply_text_color(widget, 'primary')
 
+_LIGHT_ITALIC_STYLE = f"color: {COLORS['text_light']}; font-style: italic;"
+
+
 def apply_text_style_light_italic(widget):
     """
     Применение стиля светлого текста с курсивом (для информационных сообщений).
@@ -582,7 +617,7 @@ def apply_text_style_light_italic(widget):
         widget: Виджет
     """
     current_style = widget.styleSheet() or ""
-    widget.setStyleSheet(f"{current_style} color: {COLORS['text_light']}; font-style: italic;")
+    widget.setStyleSheet(_extended_style(current_style, _LIGHT_ITALIC_STYLE))
 
 # Функция для получения информации о масштабировании
 def get_scaling_info():
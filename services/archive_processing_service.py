@@ -164,15 +164,18 @@ class ArchiveProcessingService:
 
     @staticmethod
     def group_matches_by_score(matches: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
-        """Разбивает совпадения на блоки по точности."""
-        groups = {"exact": [], "good": []}
+        """Разбивает совпадения на блоки по точности (один проход, без сортировки)."""
+        exact: List[Dict[str, Any]] = []
+        good: List[Dict[str, Any]] = []
+        add_exact = exact.append
+        add_good = good.append
         for match in matches:
             score = match.get("score", 0)
             if score >= 100:
-                groups["exact"].append(match)
+                add_exact(match)
             elif score >= 85:
-                groups["good"].append(match)
-        return groups
+                add_good(match)
+        return {"exact": exact, "good": good}
 
     @staticmethod
     def build_display_chunks(match: Dict[str, Any], download_dir: Path) -> Dict[str, str]:
@@ -65,6 +65,8 @@ class ResultSaver:
                     self.tender_match_repo.save_match_details,
                     match_id,
                     matches,
+                    tender_id,
+                    registry_type,
                 )
             else:
                 logger.debug(f"Нет совпадений для торга {tender_id}, детали не обновляются")
@@ -15,6 +15,7 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 import re
 
 import requests
+from requests.adapters import HTTPAdapter
 from loguru import logger
 
 from core.exceptions import DocumentSearchError
@@ -34,6 +35,11 @@ class DocumentDownloader:
         "Connection": "keep-alive",
     }
 
+    # Размер пула keep-alive соединений сессии (не меньше числа потоков скачивания)
+    HTTP_POOL_SIZE = 16
+    # Число параллельных скачиваний частей архива
+    MAX_PARALLEL_DOWNLOADS = 8
+
     ARCHIVE_PATTERN = re.compile(
         r"^(?P<base>.+?)(?:[._ -]*(?:part)?(?P<part>\d+))?\.(rar|zip|7z)$",
         re.IGNORECASE,
@@ -43,17 +49,24 @@ class DocumentDownloader:
         self,
         download_dir: Path,
         progress_callback: Optional[callable] = None,
+        pool_size: Optional[int] = None,
     ):
         """
         Args:
             download_dir: Директория для сохранения файлов
             progress_callback: Функция для обновления прогресса (stage, progress, detail)
+            pool_size: Размер пула HTTP-соединений (по умолчанию HTTP_POOL_SIZE)
         """
         self.download_dir = Path(download_dir)
         self.download_dir.mkdir(parents=True, exist_ok=True)
         self.progress_callback = progress_callback
         self.http_session = requests.Session()
         self.http_session.headers.update(self.DEFAULT_HEADERS)
+        # Соединения переиспользуются всеми потоками скачивания (без повторных TCP/TLS рукопожатий)
+        pool_size = pool_size or self.HTTP_POOL_SIZE
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.http_session.mount("http://", adapter)
+        self.http_session.mount("https://", adapter)
         self._active_downloads: List[Path] = []
 
     def _update_progress(self, stage: str, progress: int, detail: Optional[str] = None):
@@ -81,7 +94,9 @@ class DocumentDownloader:
             file_name = f"{file_name}.xlsx"
 
         destination_dir = target_dir or self.download_dir
-        destination_dir.mkdir(parents=True, exist_ok=True)
+        # download_dir создается в __init__, повторная проверка не нужна
+        if destination_dir is not self.download_dir:
+            destination_dir.mkdir(parents=True, exist_ok=True)
         destination = destination_dir / file_name
         logger.info(f"Начинаю скачивание документа '{file_name}' по ссылке {url}")
 
@@ -162,27 +177,17 @@ class DocumentDownloader:
             f"Для архива найдено частей: {len(related_docs)} "
             f"({', '.join(doc.get('file_name') or '' for doc in related_docs)})",
         )
-        paths: List[Path] = []
-        batch_size = 8
-        total_docs = len(related_docs)
-        for start in range(0, total_docs, batch_size):
-            end = min(start + batch_size, total_docs)
-            chunk = related_docs[start:end]
-            logger.info(
-                f"Скачивание документов {start + 1}-{end} из {total_docs} параллельно",
-            )
-            chunk_paths = self._download_documents_batch(chunk, target_dir)
-            paths.extend(chunk_paths)
-        return paths
+        logger.info(f"Скачивание документов: {len(related_docs)} параллельно")
+        return self._download_documents_batch(related_docs, target_dir)
 
     def _download_documents_batch(
         self,
         documents: List[Dict[str, Any]],
         target_dir: Path,
     ) -> List[Path]:
-        """Параллельная загрузка группы документов с сохранением порядка."""
+        """Параллельная загрузка группы документов с сохранением порядка (один пул на группу)."""
         ordered_paths: List[Optional[Path]] = [None] * len(documents)
-        with ThreadPoolExecutor(max_workers=min(8, len(documents))) as executor:
+        with ThreadPoolExecutor(max_workers=min(self.MAX_PARALLEL_DOWNLOADS, len(documents))) as executor:
             future_map = {
                 executor.submit(self.download_document, doc, target_dir): index
                 for index, doc in enumerate(documents)
@@ -6,8 +6,9 @@
 
 from __future__ import annotations
 
+import threading
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 from loguru import logger
 
@@ -56,9 +57,12 @@ class DocumentSearchService:
         self.download_dir.mkdir(parents=True, exist_ok=True)
         self.cleanup_manager = cleanup_manager or ArchiveCleanupManager()
         self.progress_callback = progress_callback
+        # Обработчик прогресса текущего вызова run_document_search (свой у каждого потока)
+        self._call_progress = threading.local()
 
-        # Инициализируем модули
-        self._downloader = DocumentDownloader(self.download_dir, progress_callback)
+        # Модули сообщают прогресс через _dispatch_progress: обработчик вызова
+        # подставляется без замены progress_callback у общего сервиса
+        self._downloader = DocumentDownloader(self.download_dir, self._dispatch_progress)
         self._selector = DocumentSelector()
         self._extractor = ArchiveExtractor(unrar_path, winrar_path)
         
@@ -70,19 +74,24 @@ class DocumentSearchService:
             selector=self._selector,
             extractor=self._extractor,
             cleanup_manager=self.cleanup_manager,
-            progress_callback=progress_callback,
+            progress_callback=self._dispatch_progress,
         )
         
         # Для обратной совместимости
         self._product_names: Optional[List[str]] = None
 
+    def _dispatch_progress(self, stage: str, progress: int, detail: Optional[str] = None):
+        """Передача прогресса обработчику текущего вызова или общему callback"""
+        callback = getattr(self._call_progress, "callback", None) or self.progress_callback
+        if callback:
+            callback(stage, progress, detail)
+
     def _update_progress(self, stage: str, progress: int, detail: Optional[str] = None):
         """Обновление прогресса через callback"""
-        if self.progress_callback:
-            try:
-                self.progress_callback(stage, progress, detail)
-            except Exception as error:
-                logger.debug(f"Ошибка при обновлении прогресса: {error}")
+        try:
+            self._dispatch_progress(stage, progress, detail)
+        except Exception as error:
+            logger.debug(f"Ошибка при обновлении прогресса: {error}")
 
     def ensure_products_loaded(self) -> None:
         """Ленивая загрузка названий товаров (по требованию пользователя)."""
@@ -94,6 +103,7 @@ class DocumentSearchService:
         documents: List[Dict[str, Any]],
         tender_id: Optional[int] = None,
         registry_type: str = "44fz",
+        progress_callback: Optional[Callable[[str, int, Optional[str]], None]] = None,
     ) -> Dict[str, Any]:
         """
         Основной сценарий: найти документы, скачать и выполнить поиск.
@@ -102,10 +112,25 @@ class DocumentSearchService:
             documents: Метаданные документов торга
             tender_id: ID торга для создания папки
             registry_type: Тип реестра (44fz/223fz)
+            progress_callback: Обработчик прогресса только этого вызова
+                (вызывается в потоке поиска; по умолчанию - общий callback)
 
         Returns:
             Словарь с путем к файлу и найденными совпадениями
         """
+        previous_callback = getattr(self._call_progress, "callback", None)
+        self._call_progress.callback = progress_callback
+        try:
+            return self._run_document_search(documents, tender_id, registry_type)
+        finally:
+            self._call_progress.callback = previous_callback
+
+    def _run_document_search(
+        self,
+        documents: List[Dict[str, Any]],
+        tender_id: Optional[int],
+        registry_type: str,
+    ) -> Dict[str, Any]:
         if not documents:
             raise DocumentSearchError("У выбранного торга нет приложенных документов.")
 
@@ -9,19 +9,73 @@
 """
 
 from typing import Optional, Dict, Any, List, Sequence
+from collections import OrderedDict
 from datetime import datetime
 import json
+import threading
 from loguru import logger
 from core.tender_database import TenderDatabaseManager
 from core.exceptions import DatabaseQueryError, DatabaseConnectionError
 from psycopg2.extras import RealDictCursor
 
 
+# Маркер отсутствия записи в кэше (None - закешированный пустой результат)
+_MISS = object()
+
+
+class _LRU(OrderedDict):
+    """
+    Словарь с ограничением размера: при переполнении удаляются самые старые записи.
+    
+    Заполняется и из пула потоков (подготовка списка закупок), поэтому
+    чтение, запись и удаление (в том числе pop и clear при сбросе кэша)
+    выполняются под блокировкой.
+    """
+    
+    def __init__(self, maxlen: int):
+        super().__init__()
+        self.maxlen = maxlen
+        self._lock = threading.RLock()
+    
+    def __setitem__(self, key, value):
+        with self._lock:
+            super().__setitem__(key, value)
+            self.move_to_end(key)
+            while len(self) > self.maxlen:
+                self.popitem(last=False)
+    
+    def lookup(self, key):
+        """Значение по ключу (с отметкой использования) или _MISS"""
+        with self._lock:
+            if key not in self:
+                return _MISS
+            self.move_to_end(key)
+            return super().__getitem__(key)
+    
+    def pop(self, key, *default):
+        with self._lock:
+            return super().pop(key, *default)
+    
+    def clear(self):
+        with self._lock:
+            super().clear()
+    
+    def discard_where(self, predicate) -> None:
+        """Удаление всех записей, ключи которых удовлетворяют predicate"""
+        with self._lock:
+            for key in [key for key in self if predicate(key)]:
+                del self[key]
+
+
 class TenderMatchRepository:
     """
     Репозиторий для работы с результатами поиска совпадений
     """
     
+    # Размеры общих кэшей сводок и деталей совпадений (на все карточки списка)
+    SUMMARY_CACHE_SIZE = 1024
+    DETAILS_CACHE_SIZE = 256
+    
     def __init__(self, db_manager: TenderDatabaseManager):
         """
         Инициализация репозитория
@@ -30,6 +84,24 @@ class TenderMatchRepository:
             db_manager: Менеджер базы данных tender_monitor
         """
         self.db_manager = db_manager
+        # Ключ: (tender_id, registry_type); для деталей дополнительно limit
+        self._summary_cache = _LRU(self.SUMMARY_CACHE_SIZE)
+        self._details_cache = _LRU(self.DETAILS_CACHE_SIZE)
+    
+    def invalidate_match_cache(self, tender_id: Optional[int] = None, registry_type: Optional[str] = None) -> None:
+        """
+        Сброс кэша сводок и деталей совпадений.
+        
+        Args:
+            tender_id: ID закупки (None - сбросить весь кэш)
+            registry_type: Тип реестра ('44fz' или '223fz')
+        """
+        if tender_id is None:
+            self._summary_cache.clear()
+            self._details_cache.clear()
+            return
+        self._summary_cache.pop((tender_id, registry_type), None)
+        self._details_cache.discard_where(lambda key: key[:2] == (tender_id, registry_type))
     
     def save_match_result(
         self,
@@ -118,6 +190,9 @@ class TenderMatchRepository:
                 )
             
             self.db_manager.execute_update(query, params)
+            # Кэш сбрасывается после записи: чтение из пула потоков до записи
+            # иначе вернуло бы в кэш старую сводку
+            self.invalidate_match_cache(tender_id, registry_type)
             if match_id is None:
                 match_id = self._fetch_match_id(tender_id, registry_type)
             
@@ -144,10 +219,23 @@ class TenderMatchRepository:
             logger.error(f"Ошибка при сохранении результата поиска: {e}")
             return None
 
-    def save_match_details(self, match_id: int, details: Sequence[Dict[str, Any]]) -> None:
+    def save_match_details(
+        self,
+        match_id: int,
+        details: Sequence[Dict[str, Any]],
+        tender_id: Optional[int] = None,
+        registry_type: Optional[str] = None,
+    ) -> None:
         """
         Сохраняет детальные совпадения для записи tender_document_matches.
+        
+        Args:
+            match_id: ID записи tender_document_matches
+            details: Совпадения для сохранения
+            tender_id: ID закупки (для сброса кэша; None - определяется по match_id)
+            registry_type: Тип реестра ('44fz' или '223fz')
         """
+        written = False
         try:
             # Проверяем существование таблицы
             if not self._table_exists("tender_document_match_details"):
@@ -161,6 +249,7 @@ class TenderMatchRepository:
                 return
             
             # Удаляем старые детали только если есть новые для вставки
+            written = True
             delete_query = """
                 DELETE FROM tender_document_match_details
                 WHERE match_id = %s
@@ -278,6 +367,14 @@ class TenderMatchRepository:
                     logger.info(f"  ... и еще {len(details) - 10} совпадений")
         except Exception as error:
             logger.error(f"Ошибка при сохранении деталей совпадений (match_id={match_id}): {error}")
+        finally:
+            # Кэш сбрасывается после записи (в том числе прерванной) и только
+            # для этой закупки: кэш хранится по (tender_id, registry_type)
+            if written:
+                if tender_id is None:
+                    tender_id, registry_type = self._fetch_match_key(match_id)
+                if tender_id is not None:
+                    self.invalidate_match_cache(tender_id, registry_type)
     
     def _table_exists(self, table_name: str) -> bool:
         """
@@ -319,39 +416,42 @@ class TenderMatchRepository:
             Словарь с данными результата или None
         """
         try:
-            query = """
-                SELECT 
-                    id,
-                    tender_id,
-                    registry_type,
-                    match_count,
-                    match_percentage,
-                    is_interesting,
-                    processed_at,
-                    processing_time_seconds,
-                    total_files_processed,
-                    total_size_bytes
-                FROM tender_document_matches
-                WHERE tender_id = %s AND registry_type = %s
-            """
-            logger.debug(
-                "[get_match_result] tender_id=%s, registry_type=%s",
-                tender_id,
-                registry_type,
-            )
-            results = self.db_manager.execute_query(
-                query,
-                (tender_id, registry_type),
-                RealDictCursor
-            )
-            if results:
-                return dict(results[0])
-            return None
-            
+            return self._query_match_result(tender_id, registry_type)
         except Exception as e:
             logger.error(f"Ошибка при получении результата поиска: {e}")
             return None
     
+    def _query_match_result(self, tender_id: int, registry_type: str) -> Optional[Dict[str, Any]]:
+        """Запрос результата поиска (ошибка БД пробрасывается вызывающему)"""
+        query = """
+            SELECT 
+                id,
+                tender_id,
+                registry_type,
+                match_count,
+                match_percentage,
+                is_interesting,
+                processed_at,
+                processing_time_seconds,
+                total_files_processed,
+                total_size_bytes
+            FROM tender_document_matches
+            WHERE tender_id = %s AND registry_type = %s
+        """
+        logger.debug(
+            "[get_match_result] tender_id=%s, registry_type=%s",
+            tender_id,
+            registry_type,
+        )
+        results = self.db_manager.execute_query(
+            query,
+            (tender_id, registry_type),
+            RealDictCursor
+        )
+        if results:
+            return dict(results[0])
+        return None
+    
     def get_match_summary(
         self,
         tender_id: int,
@@ -372,13 +472,29 @@ class TenderMatchRepository:
             - total_count: общее количество совпадений
             Или None, если закупка не обработана
         """
+        cached = self._summary_cache.lookup((tender_id, registry_type))
+        if cached is not _MISS:
+            return cached
+        summary = self._load_match_summary(tender_id, registry_type)
+        if summary is _MISS:
+            # Ошибка БД не кэшируется: следующий вызов повторит запрос
+            return None
+        self._summary_cache[(tender_id, registry_type)] = summary
+        return summary
+    
+    def _load_match_summary(
+        self,
+        tender_id: int,
+        registry_type: str,
+    ) -> Any:
+        """Загрузка сводки по совпадениям из БД (без кэша); _MISS при ошибке запроса"""
         try:
             logger.debug(
                 "[get_match_summary] tender_id=%s, registry_type=%s",
                 tender_id,
                 registry_type,
             )
-            match_result = self.get_match_result(tender_id, registry_type)
+            match_result = self._query_match_result(tender_id, registry_type)
             if not match_result:
                 return None
             
@@ -433,7 +549,7 @@ class TenderMatchRepository:
             
         except Exception as e:
             logger.error("Ошибка при получении сводки по совпадениям: %s", e)
-            return None
+            return _MISS
     
     def get_match_details(
         self,
@@ -455,8 +571,25 @@ class TenderMatchRepository:
         if limit <= 0:
             return []
         
+        key = (tender_id, registry_type, limit)
+        cached = self._details_cache.lookup(key)
+        if cached is not _MISS:
+            return cached
+        details = self._load_match_details(tender_id, registry_type, limit)
+        if details is _MISS:
+            return []
+        self._details_cache[key] = details
+        return details
+    
+    def _load_match_details(
+        self,
+        tender_id: int,
+        registry_type: str,
+        limit: int,
+    ) -> Any:
+        """Загрузка детализированных совпадений из БД (без кэша); _MISS при ошибке запроса"""
         try:
-            match_result = self.get_match_result(tender_id, registry_type)
+            match_result = self._query_match_result(tender_id, registry_type)
             if not match_result:
                 return []
             
@@ -490,7 +623,107 @@ class TenderMatchRepository:
             return [dict(row) for row in results] if results else []
         except Exception as exc:
             logger.error("Ошибка при получении деталей совпадений: %s", exc)
-            return []
+            return _MISS
+    
+    def get_match_details_batch(
+        self,
+        tender_ids: List[int],
+        registry_type: str,
+        limit: int = 10,
+    ) -> Dict[int, List[Dict[str, Any]]]:
+        """
+        Получение детализированных совпадений для нескольких закупок одним запросом.
+        
+        Закупки, детали которых уже есть в кэше, в запрос не попадают;
+        загруженные детали кэшируются так же, как в get_match_details.
+        
+        Args:
+            tender_ids: Список ID закупок
+            registry_type: Тип реестра ('44fz' или '223fz')
+            limit: Максимальное количество записей на закупку
+        
+        Returns:
+            Словарь {tender_id: список совпадений}
+        """
+        if limit <= 0:
+            return {tender_id: [] for tender_id in tender_ids}
+        
+        details_by_tender = {}
+        missing_ids = []
+        for tender_id in tender_ids:
+            cached = self._details_cache.lookup((tender_id, registry_type, limit))
+            if cached is _MISS:
+                missing_ids.append(tender_id)
+            else:
+                details_by_tender[tender_id] = cached
+        if not missing_ids:
+            return details_by_tender
+        
+        loaded = self._load_match_details_batch(missing_ids, registry_type, limit)
+        if loaded is None:
+            return details_by_tender
+        for tender_id in missing_ids:
+            details = loaded.get(tender_id, [])
+            self._details_cache[(tender_id, registry_type, limit)] = details
+            details_by_tender[tender_id] = details
+        return details_by_tender
+    
+    def _load_match_details_batch(
+        self,
+        tender_ids: List[int],
+        registry_type: str,
+        limit: int,
+    ) -> Optional[Dict[int, List[Dict[str, Any]]]]:
+        """Загрузка деталей одним запросом (без кэша); None при ошибке запроса"""
+        if not self._table_exists("tender_document_match_details"):
+            return {}
+        
+        try:
+            placeholders = ','.join(['%s'] * len(tender_ids))
+            query = f"""
+                SELECT
+                    tender_id,
+                    id,
+                    product_name,
+                    score,
+                    sheet_name,
+                    row_index,
+                    column_letter,
+                    cell_address,
+                    source_file,
+                    matched_text,
+                    matched_display_text,
+                    row_data
+                FROM (
+                    SELECT
+                        m.tender_id,
+                        d.*,
+                        ROW_NUMBER() OVER (
+                            PARTITION BY d.match_id ORDER BY d.score DESC, d.id ASC
+                        ) AS row_number
+                    FROM tender_document_matches m
+                    JOIN tender_document_match_details d ON d.match_id = m.id
+                    WHERE m.tender_id IN ({placeholders}) AND m.registry_type = %s
+                ) ranked
+                WHERE row_number <= %s
+                ORDER BY tender_id, score DESC, id ASC
+            """
+            params = list(tender_ids) + [registry_type, limit]
+            results = self.db_manager.execute_query(
+                query,
+                tuple(params),
+                RealDictCursor
+            )
+            
+            details_by_tender: Dict[int, List[Dict[str, Any]]] = {}
+            for row in results or []:
+                row = dict(row)
+                details_by_tender.setdefault(row.pop('tender_id'), []).append(row)
+            return details_by_tender
+            
+        except Exception as e:
+            logger.error(f"Ошибка при получении деталей совпадений (batch): {e}")
+            return None
     
     def set_interesting_status(
         self,
@@ -519,6 +752,7 @@ class TenderMatchRepository:
                 query,
                 (is_interesting, tender_id, registry_type)
             )
+            self.invalidate_match_cache(tender_id, registry_type)
             
             status_text = "интересно" if is_interesting else "неинтересно" if is_interesting is False else "сброшен"
             logger.info(
@@ -584,6 +818,107 @@ class TenderMatchRepository:
             logger.error(f"Ошибка при получении результатов поиска (batch): {e}")
             return {}
     
+    def get_match_summaries_batch(
+        self,
+        tender_ids: List[int],
+        registry_type: str,
+    ) -> Optional[Dict[int, Dict[str, Any]]]:
+        """
+        Получение сводок по совпадениям для нескольких закупок одним запросом.
+        
+        Формат каждой сводки совпадает с get_match_summary.
+        
+        Args:
+            tender_ids: Список ID закупок
+            registry_type: Тип реестра ('44fz' или '223fz')
+        
+        Returns:
+            Словарь {tender_id: сводка}; необработанные закупки в словарь не попадают.
+            None при ошибке запроса: закупки не считаются необработанными
+        """
+        if not tender_ids:
+            return {}
+        
+        summaries = self._load_match_summaries_batch(tender_ids, registry_type)
+        if summaries is None:
+            return None
+        
+        # Свежие сводки обновляют общий кэш; детали закупок, у которых
+        # сводка изменилась, сбрасываются
+        for tender_id in tender_ids:
+            key = (tender_id, registry_type)
+            summary = summaries.get(tender_id)
+            if self._summary_cache.lookup(key) != summary:
+                self.invalidate_match_cache(tender_id, registry_type)
+            self._summary_cache[key] = summary
+        return summaries
+    
+    def _load_match_summaries_batch(
+        self,
+        tender_ids: List[int],
+        registry_type: str,
+    ) -> Optional[Dict[int, Dict[str, Any]]]:
+        """Загрузка сводок одним запросом (без кэша); None при ошибке запроса"""
+        if not self._table_exists("tender_document_match_details"):
+            return {
+                tender_id: {
+                    'match_result': match_result,
+                    'exact_count': 0,
+                    'good_count': 0,
+                    'brown_count': 0,
+                    'total_count': match_result.get('match_count', 0),
+                }
+                for tender_id, match_result in self.get_match_results_batch(tender_ids, registry_type).items()
+            }
+        
+        try:
+            placeholders = ','.join(['%s'] * len(tender_ids))
+            query = f"""
+                SELECT 
+                    m.id,
+                    m.tender_id,
+                    m.registry_type,
+                    m.match_count,
+                    m.match_percentage,
+                    m.is_interesting,
+                    m.processed_at,
+                    m.processing_time_seconds,
+                    m.total_files_processed,
+                    m.total_size_bytes,
+                    COUNT(d.id) FILTER (WHERE d.score >= 100.0) as exact_count,
+                    COUNT(d.id) FILTER (WHERE d.score >= 85.0 AND d.score < 100.0) as good_count,
+                    COUNT(d.id) FILTER (WHERE d.score >= 56.0 AND d.score < 85.0) as brown_count,
+                    COUNT(d.id) as total_count
+                FROM tender_document_matches m
+                LEFT JOIN tender_document_match_details d ON d.match_id = m.id
+                WHERE m.tender_id IN ({placeholders}) AND m.registry_type = %s
+                GROUP BY m.id
+            """
+            params = list(tender_ids) + [registry_type]
+            results = self.db_manager.execute_query(
+                query,
+                tuple(params),
+                RealDictCursor
+            )
+            
+            summaries = {}
+            for row in results or []:
+                row = dict(row)
+                stats = {
+                    key: int(row.pop(key, 0) or 0)
+                    for key in ('exact_count', 'good_count', 'brown_count', 'total_count')
+                }
+                summaries[row['tender_id']] = {
+                    'match_result': row,
+                    **stats,
+                    'error_reason': None,  # Колонка error_reason не существует в таблице
+                }
+            return summaries
+            
+        except Exception as e:
+            logger.error(f"Ошибка при получении сводок по совпадениям (batch): {e}")
+            return None
+    
     def filter_uninteresting_tenders(
         self,
         tender_ids: List[int],
@@ -713,4 +1048,19 @@ class TenderMatchRepository:
         if results:
             return results[0].get("id")
         return None
+    
+    def _fetch_match_key(self, match_id: int) -> tuple:
+        """(tender_id, registry_type) записи tender_document_matches; (None, None) при ошибке"""
+        try:
+            results = self.db_manager.execute_query(
+                "SELECT tender_id, registry_type FROM tender_document_matches WHERE id = %s",
+                (match_id,),
+                RealDictCursor,
+            )
+        except Exception as error:
+            logger.error(f"Не удалось определить закупку по match_id={match_id}: {error}")
+            return None, None
+        if results:
+            return results[0].get("tender_id"), results[0].get("registry_type")
+        return None, None
 
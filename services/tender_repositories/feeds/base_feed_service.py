@@ -4,6 +4,9 @@
 
 from __future__ import annotations
 
+import sys
+from datetime import date, datetime
+from functools import lru_cache
 from typing import List, Dict, Any, Optional
 
 from loguru import logger
@@ -15,6 +18,58 @@ from services.tender_repositories.tender_query_builder import TenderQueryBuilder
 from services.tender_repositories.feeds.feed_filters import FeedFilters
 
 
+# Поля дат, которые приводятся к datetime.date один раз при загрузке
+TENDER_DATE_FIELDS = ("start_date", "end_date", "delivery_start_date", "delivery_end_date")
+
+# Строковые поля, значения которых повторяются у многих закупок выборки
+# (psycopg2 создает отдельную строку на каждую строку результата)
+TENDER_SHARED_STRING_FIELDS = (
+    "region_name", "delivery_region", "platform_name",
+    "customer_short_name", "customer_full_name",
+    "balance_holder_name", "okpd_main_code", "okpd_sub_code", "okpd_name",
+)
+
+
+@lru_cache(maxsize=4096)
+def _parse_date(value: str) -> Optional[date]:
+    # ISO-дата из БД разбирается быстрым fromisoformat; разбор по '-' (без strptime
+    # и локали) - для дат без ведущих нулей вида "2024-3-5"
+    try:
+        return date.fromisoformat(value[:10])
+    except ValueError:
+        pass
+    head = value.split(None, 1)
+    parts = head[0].split("T", 1)[0].split("-") if head else ()
+    if len(parts) != 3 or not all(part.isdigit() for part in parts):
+        return None
+    try:
+        return date(int(parts[0]), int(parts[1]), int(parts[2]))
+    except ValueError:
+        return None
+
+
+def normalize_tender_row(row: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Приводит строковые даты и datetime закупки к datetime.date (на месте).
+
+    Виджеты карточки и диалога показывают только день, поэтому время из
+    timestamp-колонок отбрасывается здесь, а не при каждом форматировании.
+    Нераспознанная строка остается как есть. Повторяющиеся строковые значения
+    (регион, площадка, заказчик, ОКПД) заменяются одним общим объектом строки.
+    """
+    for field in TENDER_DATE_FIELDS:
+        value = row.get(field)
+        if isinstance(value, str):
+            row[field] = _parse_date(value) or value
+        elif isinstance(value, datetime):
+            row[field] = value.date()
+    for field in TENDER_SHARED_STRING_FIELDS:
+        value = row.get(field)
+        if type(value) is str:
+            row[field] = sys.intern(value)
+    return row
+
+
 class BaseFeedService:
     """Общий функционал для выборки тендеров разных типов."""
 
@@ -40,7 +95,7 @@ class BaseFeedService:
             tuple(select_params) if select_params else None,
             RealDictCursor,
         )
-        tenders = [dict(row) for row in results] if results else []
+        tenders = [normalize_tender_row(dict(row)) for row in results] if results else []
 
         total_count = self._fetch_total_count(count_query, count_params)
         total = total_count if total_count is not None else "неизвестно"
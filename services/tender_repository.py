@@ -18,6 +18,7 @@ from services.tender_repositories.document_stop_phrases_repository import Docume
 from services.tender_repositories.region_repository import RegionRepository
 from services.tender_repositories.tender_documents_repository import TenderDocumentsRepository
 from services.tender_repositories.tender_query_builder import TenderQueryBuilder
+from services.tender_repositories.feeds.base_feed_service import normalize_tender_row
 from services.tender_repositories.feeds.feed_filters import FeedFilters, WonFilters
 from services.tender_repositories.feeds.new_tenders_service import NewTendersService
 from services.tender_repositories.feeds.won_tenders_service import WonTendersService
@@ -262,7 +263,7 @@ class TenderRepository:
         """
         try:
             results = self.db_manager.execute_query(query, tuple(tender_ids), RealDictCursor)
-            return [dict(row) for row in results] if results else []
+            return [normalize_tender_row(dict(row)) for row in results] if results else []
         except Exception as error:
             logger.error("Ошибка при получении торгов %s по ID: %s", registry_type, error)
             return []
@@ -0,0 +1,47 @@
+"""
+Тесты приведения строк закупки при загрузке (normalize_tender_row).
+
+Проверяет:
+- Разбор ISO-дат и timestamp-строк через fromisoformat
+- Даты без ведущих нулей и нераспознанные строки
+- Отбрасывание времени у datetime
+"""
+
+import unittest
+from datetime import date, datetime
+
+from services.tender_repositories.feeds.base_feed_service import normalize_tender_row
+
+
+class NormalizeTenderRowTestCase(unittest.TestCase):
+    """Тесты нормализации дат закупки."""
+
+    def test_iso_date_string(self):
+        row = normalize_tender_row({"start_date": "2024-03-05"})
+        self.assertEqual(row["start_date"], date(2024, 3, 5))
+
+    def test_timestamp_string_keeps_day(self):
+        row = normalize_tender_row({
+            "end_date": "2024-03-05 10:15:00",
+            "delivery_end_date": "2024-03-05T23:59:59+03:00",
+        })
+        self.assertEqual(row["end_date"], date(2024, 3, 5))
+        self.assertEqual(row["delivery_end_date"], date(2024, 3, 5))
+
+    def test_date_without_leading_zeros(self):
+        row = normalize_tender_row({"delivery_start_date": "2024-3-5"})
+        self.assertEqual(row["delivery_start_date"], date(2024, 3, 5))
+
+    def test_unparsed_string_is_kept(self):
+        row = normalize_tender_row({"start_date": "не указана", "end_date": "2024-13-40"})
+        self.assertEqual(row["start_date"], "не указана")
+        self.assertEqual(row["end_date"], "2024-13-40")
+
+    def test_datetime_is_truncated_to_date(self):
+        row = normalize_tender_row({"start_date": datetime(2024, 3, 5, 10, 15)})
+        self.assertEqual(row["start_date"], date(2024, 3, 5))
+        self.assertIs(type(row["start_date"]), date)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -81,6 +81,31 @@ class DocumentSearchServiceTestCase(unittest.TestCase):
 
         self.assertTrue(result["matches"])
 
+    def test_run_document_search_progress_callback_per_call(self):
+        """Обработчик прогресса вызова не заменяет общий callback сервиса."""
+        shared_progress, call_progress = [], []
+        service = DocumentSearchService(
+            self.db_manager,
+            self.download_dir,
+            cleanup_manager=self.cleanup_manager,
+            progress_callback=lambda *args: shared_progress.append(args),
+        )
+
+        def fake_run(documents, tender_id, registry_type):
+            service.coordinator._update_progress("Скачивание документов", 10, None)
+            return {}
+
+        with patch.object(service, "_run_document_search", side_effect=fake_run):
+            service.run_document_search(
+                [{"file_name": "Смета.xlsx"}],
+                tender_id=1,
+                progress_callback=lambda *args: call_progress.append(args),
+            )
+        service.coordinator._update_progress("Завершено", 100, None)
+
+        self.assertEqual(call_progress, [("Скачивание документов", 10, None)])
+        self.assertEqual(shared_progress, [("Завершено", 100, None)])
+
     def test_parallel_download_preserves_order(self):
         """Параллельная загрузка должна сохранять исходный порядок частей."""
         docs = [
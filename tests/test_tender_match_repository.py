@@ -0,0 +1,139 @@
+"""
+Тесты для кэша сводок и деталей совпадений в TenderMatchRepository
+"""
+
+import pytest
+from unittest.mock import Mock
+from services.tender_match_repository import TenderMatchRepository, _LRU
+
+
+class TestLRU:
+    """Тесты для словаря с ограничением размера"""
+
+    def test_evicts_least_recently_used(self):
+        """При переполнении удаляется запись, к которой дольше всего не обращались"""
+        cache = _LRU(2)
+        cache['a'] = 1
+        cache['b'] = 2
+        cache.lookup('a')
+        cache['c'] = 3
+
+        assert list(cache) == ['a', 'c']
+
+
+class TestTenderMatchRepositoryCache:
+    """Тесты для общего кэша репозитория"""
+
+    @pytest.fixture
+    def mock_db_manager(self):
+        """Мок менеджера БД"""
+        db = Mock()
+        db.execute_query = Mock(return_value=[])
+        db.execute_update = Mock()
+        return db
+
+    @pytest.fixture
+    def match_repo(self, mock_db_manager):
+        """Создание репозитория (таблица деталей существует)"""
+        repo = TenderMatchRepository(mock_db_manager)
+        repo._table_exists = Mock(return_value=True)
+        return repo
+
+    def test_batch_fills_summary_cache(self, match_repo, mock_db_manager):
+        """Батч-загрузка кэширует сводки, в том числе отсутствующие (None)"""
+        mock_db_manager.execute_query.return_value = [
+            {
+                'id': 10,
+                'tender_id': 1,
+                'registry_type': '44fz',
+                'match_count': 2,
+                'exact_count': 1,
+                'good_count': 1,
+                'brown_count': 0,
+                'total_count': 2,
+            }
+        ]
+
+        summaries = match_repo.get_match_summaries_batch([1, 2], '44fz')
+        calls = mock_db_manager.execute_query.call_count
+
+        assert summaries[1]['exact_count'] == 1
+        assert 2 not in summaries
+        assert match_repo.get_match_summary(1, '44fz') == summaries[1]
+        assert match_repo.get_match_summary(2, '44fz') is None
+        assert mock_db_manager.execute_query.call_count == calls
+
+    def test_details_cached_until_invalidated(self, match_repo, mock_db_manager):
+        """Детали запрашиваются из БД один раз до сброса кэша"""
+        mock_db_manager.execute_query.side_effect = [
+            [{'id': 10, 'tender_id': 1, 'match_count': 1}],
+            [{'id': 1, 'score': 100.0}],
+        ] * 2
+
+        first = match_repo.get_match_details(1, '44fz', limit=20)
+        second = match_repo.get_match_details(1, '44fz', limit=20)
+
+        assert first == second == [{'id': 1, 'score': 100.0}]
+        assert mock_db_manager.execute_query.call_count == 2
+
+        match_repo.invalidate_match_cache(1, '44fz')
+        match_repo.get_match_details(1, '44fz', limit=20)
+
+        assert mock_db_manager.execute_query.call_count == 4
+
+    def test_details_batch_fills_details_cache(self, match_repo, mock_db_manager):
+        """Батч-загрузка деталей - один запрос; затем детали берутся из кэша"""
+        mock_db_manager.execute_query.return_value = [
+            {'tender_id': 1, 'id': 1, 'score': 100.0},
+            {'tender_id': 1, 'id': 2, 'score': 90.0},
+        ]
+
+        details = match_repo.get_match_details_batch([1, 2], '44fz', limit=20)
+
+        assert details == {1: [{'id': 1, 'score': 100.0}, {'id': 2, 'score': 90.0}], 2: []}
+        assert mock_db_manager.execute_query.call_count == 1
+        assert match_repo.get_match_details(1, '44fz', limit=20) == details[1]
+        assert match_repo.get_match_details(2, '44fz', limit=20) == []
+        assert match_repo.get_match_details_batch([1, 2], '44fz', limit=20) == details
+        assert mock_db_manager.execute_query.call_count == 1
+
+    def test_save_details_invalidates_only_saved_tender_after_write(self, match_repo, mock_db_manager):
+        """Сохранение деталей сбрасывает кэш своей закупки после записи, остальные остаются"""
+        from services.tender_match_repository import _MISS
+        match_repo._summary_cache[(1, '44fz')] = {'total_count': 1}
+        match_repo._summary_cache[(2, '44fz')] = {'total_count': 2}
+        cached_during_write = []
+        mock_db_manager.execute_update.side_effect = lambda *args: cached_during_write.append(
+            match_repo._summary_cache.lookup((1, '44fz')) is not _MISS
+        )
+
+        match_repo.save_match_details(10, [{'score': 100.0}], 1, '44fz')
+
+        assert cached_during_write and all(cached_during_write)
+        assert match_repo._summary_cache.lookup((1, '44fz')) is _MISS
+        assert match_repo._summary_cache.lookup((2, '44fz')) == {'total_count': 2}
+
+    def test_batch_failure_is_not_cached_as_unprocessed(self, match_repo, mock_db_manager):
+        """При ошибке батч-запроса возвращается None, а сводки не кэшируются как отсутствующие"""
+        from services.tender_match_repository import _MISS
+        mock_db_manager.execute_query.side_effect = RuntimeError("connection lost")
+
+        assert match_repo.get_match_summaries_batch([1, 2], '44fz') is None
+        assert match_repo._summary_cache.lookup((1, '44fz')) is _MISS
+
+    def test_query_error_is_not_cached(self, match_repo, mock_db_manager):
+        """Ошибка БД не кэшируется: следующий вызов снова обращается к БД"""
+        mock_db_manager.execute_query.side_effect = [
+            RuntimeError("connection lost"),
+            [{'id': 10, 'tender_id': 1, 'match_count': 1}],
+            [{'exact_count': 1, 'good_count': 0, 'brown_count': 0, 'total_count': 1}],
+            RuntimeError("connection lost"),
+            [{'id': 10, 'tender_id': 1, 'match_count': 1}],
+            [{'id': 1, 'score': 100.0}],
+        ]
+
+        assert match_repo.get_match_summary(1, '44fz') is None
+        assert match_repo.get_match_summary(1, '44fz')['exact_count'] == 1
+        assert match_repo.get_match_details(1, '44fz', limit=20) == []
+        assert match_repo.get_match_details(1, '44fz', limit=20) == [{'id': 1, 'score': 100.0}]
+        assert mock_db_manager.execute_query.call_count == 6